@@ -3,15 +3,19 @@ Admin Routes - COMPLETE VERSION
 All CLI features including password change and enhanced doctor management
 """
 
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import APIRouter, HTTPException, Depends, Request, status
 from pydantic import BaseModel, EmailStr, field_validator
 from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import UpdateOne
 from typing import List, Optional
+import asyncio
 import time
 
 from api.middleware.auth import get_current_admin, hash_password, verify_password
 from models.patient import TokenData
 from core.database import db_manager
+from utils.etag import etag_response
 
 router = APIRouter()
 
@@ -55,6 +59,20 @@ class DoctorApproval(BaseModel):
 class DoctorToggle(BaseModel):
     doctor_id: str
 
+class DoctorOp(BaseModel):
+    op: str
+    doctor_id: str
+    
+    @field_validator('op')
+    @classmethod
+    def validate_op(cls, v: str) -> str:
+        if v not in ("approve", "reject", "toggle"):
+            raise ValueError('Operation must be approve, reject or toggle')
+        return v
+
+class DoctorBulkOps(BaseModel):
+    ops: List[DoctorOp]
+
 @router.post("/create")
 async def create_admin(admin_data: AdminCreate, token_data: TokenData = Depends(get_current_admin)):
     """Create new admin (requires existing admin authentication)"""
@@ -126,9 +144,8 @@ async def change_password(
     
     return {"message": "Password changed successfully"}
 
-@router.get("/doctors/pending")
-async def get_pending_doctors(token_data: TokenData = Depends(get_current_admin)):
-    """Get all pending doctor applications"""
+def _list_pending_doctors() -> list:
+    """Pending doctor applications as API dicts"""
     pending_doctors = list(db_manager.doctors.find({"status": "pending"}))
     
     result = []
@@ -144,12 +161,13 @@ async def get_pending_doctors(token_data: TokenData = Depends(get_current_admin)
     
     return result
 
-@router.get("/doctors/all")
-async def get_all_doctors(
-    search_name: Optional[str] = None,
-    token_data: TokenData = Depends(get_current_admin)
-):
-    """Get all doctors with optional name search"""
+@router.get("/doctors/pending")
+async def get_pending_doctors(token_data: TokenData = Depends(get_current_admin)):
+    """Get all pending doctor applications"""
+    return _list_pending_doctors()
+
+def _list_doctors(search_name: Optional[str] = None) -> list:
+    """All doctors (optionally filtered by name) as API dicts"""
     query = {}
     if search_name:
         query["name"] = {"$regex": search_name, "$options": "i"}
@@ -170,6 +188,15 @@ async def get_all_doctors(
     
     return result
 
+@router.get("/doctors/all")
+async def get_all_doctors(
+    request: Request,
+    search_name: Optional[str] = None,
+    token_data: TokenData = Depends(get_current_admin)
+):
+    """Get all doctors with optional name search (supports If-None-Match)"""
+    return etag_response(request, _list_doctors(search_name))
+
 @router.post("/doctors/approve")
 async def approve_doctor(
     approval: DoctorApproval,
@@ -247,15 +274,67 @@ async def toggle_doctor_status(
         "new_status": new_status
     }
 
+@router.post("/doctors/bulk")
+async def bulk_doctor_ops(
+    bulk: DoctorBulkOps,
+    token_data: TokenData = Depends(get_current_admin)
+):
+    """Apply queued approve/reject/toggle operations in a single bulk write"""
+    try:
+        doctor_ids = [ObjectId(op.doctor_id) for op in bulk.ops]
+    except (InvalidId, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid doctor ID"
+        )
+    # Canonical string form, so ids that differ only in case still match the DB
+    id_keys = [str(doctor_id) for doctor_id in doctor_ids]
+    
+    # One read for the current status of every doctor that is toggled
+    docs = await asyncio.to_thread(
+        lambda: list(db_manager.doctors.find({"_id": {"$in": doctor_ids}}, {"status": 1}))
+    )
+    current = {str(doctor["_id"]): doctor.get("status", "pending") for doctor in docs}
+    
+    missing = [key for key in id_keys if key not in current]
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Doctor not found: {', '.join(missing)}"
+        )
+    
+    now = time.time()
+    updates = []
+    for op, doctor_id, key in zip(bulk.ops, doctor_ids, id_keys):
+        if op.op == "toggle":
+            new_status = "disabled" if current[key] == "approved" else "approved"
+            fields = {"status": new_status, "modified_by": token_data.email, "modified_at": now}
+        else:
+            new_status = "approved" if op.op == "approve" else "rejected"
+            fields = {"status": new_status, "approved_by": token_data.email, "approved_at": now}
+        
+        current[key] = new_status
+        updates.append(UpdateOne({"_id": doctor_id}, {"$set": fields}))
+    
+    if updates:
+        await asyncio.to_thread(db_manager.doctors.bulk_write, updates, ordered=True)
+    
+    return {
+        "message": f"Applied {len(updates)} doctor update(s)",
+        "statuses": {key: current[key] for key in set(id_keys)}
+    }
+
+def _count_patients() -> dict:
+    """Total number of patients"""
+    return {"count": db_manager.patients.count_documents({})}
+
 @router.get("/patients/count")
 async def get_patient_count(token_data: TokenData = Depends(get_current_admin)):
     """Get total number of patients"""
-    count = db_manager.patients.count_documents({})
-    return {"count": count}
+    return _count_patients()
 
-@router.get("/patients/all")
-async def get_all_patients(token_data: TokenData = Depends(get_current_admin)):
-    """Get all patients (demographics only) with reference IDs"""
+def _list_patients() -> list:
+    """All patients (demographics only) with reference IDs as API dicts"""
     patients_list = []
     
     for patient in db_manager.patients.find():
@@ -279,13 +358,26 @@ async def get_all_patients(token_data: TokenData = Depends(get_current_admin)):
     
     return patients_list
 
-@router.get("/doctors/count")
-async def get_doctor_count(token_data: TokenData = Depends(get_current_admin)):
-    """Get doctor statistics"""
-    approved = db_manager.doctors.count_documents({"status": "approved"})
-    pending = db_manager.doctors.count_documents({"status": "pending"})
-    disabled = db_manager.doctors.count_documents({"status": "disabled"})
-    rejected = db_manager.doctors.count_documents({"status": "rejected"})
+@router.get("/patients/all")
+async def get_all_patients(
+    request: Request,
+    token_data: TokenData = Depends(get_current_admin)
+):
+    """Get all patients (demographics only) with reference IDs (supports If-None-Match)"""
+    return etag_response(request, _list_patients())
+
+def _count_doctors() -> dict:
+    """Doctor counts per status, from one grouped query instead of four count_documents"""
+    counts = {
+        row["_id"]: row["count"]
+        for row in db_manager.doctors.aggregate([
+            {"$group": {"_id": "$status", "count": {"$sum": 1}}}
+        ])
+    }
+    approved = counts.get("approved", 0)
+    pending = counts.get("pending", 0)
+    disabled = counts.get("disabled", 0)
+    rejected = counts.get("rejected", 0)
     
     return {
         "approved": approved,
@@ -295,6 +387,11 @@ async def get_doctor_count(token_data: TokenData = Depends(get_current_admin)):
         "total": approved + pending + disabled + rejected
     }
 
+@router.get("/doctors/count")
+async def get_doctor_count(token_data: TokenData = Depends(get_current_admin)):
+    """Get doctor statistics"""
+    return _count_doctors()
+
 @router.get("/me")
 async def get_admin_profile(token_data: TokenData = Depends(get_current_admin)):
     """Get current admin's profile"""
@@ -312,4 +409,54 @@ async def get_admin_profile(token_data: TokenData = Depends(get_current_admin)):
         "email": admin["email"],
         "created_at": admin.get("created_at"),
         "created_by": admin.get("created_by")
-    }
\ No newline at end of file
+    }
+
+# ==================== BATCH ENDPOINT ====================
+
+class BatchItem(BaseModel):
+    method: str = "GET"
+    path: str
+
+class BatchRequest(BaseModel):
+    requests: List[BatchItem]
+
+# Read-only admin endpoints that may be combined into one batch call
+# (async route handlers, or plain blocking loaders that run in a worker thread)
+BATCH_HANDLERS = {
+    "/api/admin/patients/count": _count_patients,
+    "/api/admin/patients/all": _list_patients,
+    "/api/admin/doctors/count": _count_doctors,
+    "/api/admin/doctors/pending": _list_pending_doctors,
+    "/api/admin/doctors/all": _list_doctors,
+    "/api/admin/me": get_admin_profile,
+}
+
+async def _run_batch_item(item: BatchItem, token_data: TokenData) -> dict:
+    """Run a single batched request against its internal handler"""
+    handler = BATCH_HANDLERS.get(item.path)
+    if item.method.upper() != "GET" or handler is None:
+        return {
+            "path": item.path,
+            "status_code": status.HTTP_404_NOT_FOUND,
+            "body": {"detail": f"Unsupported batch request: {item.method} {item.path}"}
+        }
+    
+    try:
+        if asyncio.iscoroutinefunction(handler):
+            body = await handler(token_data=token_data)
+        else:
+            body = await asyncio.to_thread(handler)
+        return {"path": item.path, "status_code": status.HTTP_200_OK, "body": body}
+    except HTTPException as e:
+        return {"path": item.path, "status_code": e.status_code, "body": {"detail": e.detail}}
+
+@router.post("/_batch")
+async def batch_requests(
+    batch: BatchRequest,
+    token_data: TokenData = Depends(get_current_admin)
+):
+    """Run several read-only admin requests in one round trip"""
+    responses = await asyncio.gather(
+        *(_run_batch_item(item, token_data) for item in batch.requests)
+    )
+    return {"responses": list(responses)}
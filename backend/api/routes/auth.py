@@ -7,10 +7,11 @@ Authentication Routes - IMPROVED VERSION
 
 from fastapi import APIRouter, HTTPException, status
 from datetime import timedelta
+import asyncio
 import traceback
 from pymongo.errors import DuplicateKeyError
 
-from models.patient import PatientLogin, Token, PatientCreate
+from models.patient import PatientLogin, Token, PatientCreate, PatientRegisterWithAnalysis, SymptomDetail
 from api.middleware.auth import (
     create_access_token,
     hash_password,
@@ -23,6 +24,32 @@ from core.llm import llm_manager
 router = APIRouter()
 
 
+def ensure_patient_email_available(email: str):
+    """
+    Raise 400 if a patient already uses this email (case-insensitive)
+    Patient emails are encrypted, so every record is decrypted and compared
+    """
+    target_email = email.lower().strip()
+    
+    for patient in db_manager.patients.find():
+        try:
+            decrypted_demo = db_manager.decrypt_dict(patient.get("demographic", {}))
+            existing_email = decrypted_demo.get("email", "").lower().strip()
+            
+            if existing_email == target_email:
+                print(f"❌ Duplicate email found: {target_email}")
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Email '{email}' is already registered. Please use a different email or try logging in."
+                )
+        except HTTPException:
+            raise  # Re-raise HTTP exceptions
+        except Exception:
+            continue  # Skip patients with decryption errors
+    
+    print(f"✅ Email is unique: {target_email}")
+
+
 @router.post("/patient/register", response_model=Token)
 async def register_patient(patient_data: PatientCreate):
     """
@@ -37,25 +64,7 @@ async def register_patient(patient_data: PatientCreate):
         # ============================================================
         # ✅ IMPROVED: Check for duplicate email (case-insensitive)
         # ============================================================
-        target_email = patient_data.demographic.email.lower().strip()
-        
-        for patient in db_manager.patients.find():
-            try:
-                decrypted_demo = db_manager.decrypt_dict(patient.get("demographic", {}))
-                existing_email = decrypted_demo.get("email", "").lower().strip()
-                
-                if existing_email == target_email:
-                    print(f"❌ Duplicate email found: {target_email}")
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail=f"Email '{patient_data.demographic.email}' is already registered. Please use a different email or try logging in."
-                    )
-            except HTTPException:
-                raise  # Re-raise HTTP exceptions
-            except Exception:
-                continue  # Skip patients with decryption errors
-        
-        print(f"✅ Email is unique: {target_email}")
+        ensure_patient_email_available(patient_data.demographic.email)
         
         # Hash password
         hashed_password = hash_password(patient_data.password)
@@ -197,6 +206,42 @@ async def register_patient(patient_data: PatientCreate):
             detail=f"Registration failed: {str(e)}"
         )
 
+@router.post("/patient/register-with-analysis", response_model=Token)
+async def register_patient_with_analysis(patient_data: PatientRegisterWithAnalysis):
+    """
+    Patient registration in a single round trip
+    ✅ Runs symptom analysis server-side when no reviewed symptom details are sent
+    ✅ Then registers exactly like /patient/register
+    """
+    # Reject duplicate emails before spending an LLM analysis on them
+    # (register_patient checks again, in case the email was taken meanwhile)
+    await asyncio.to_thread(ensure_patient_email_available, patient_data.demographic.email)
+    
+    if not patient_data.per_symptom:
+        # Blocking LLM calls run in a worker thread to keep the event loop free
+        symptoms = await asyncio.to_thread(
+            llm_manager.identify_symptoms,
+            patient_data.description,
+            source_lang=patient_data.source_language
+        )
+        details = await asyncio.to_thread(
+            llm_manager.extract_symptom_details,
+            patient_data.description,
+            source_lang=patient_data.source_language
+        )
+        
+        patient_data.per_symptom = {
+            symptom: SymptomDetail(
+                Duration=details.get("Duration", ""),
+                Severity=details.get("Severity", ""),
+                Frequency=details.get("Frequency", ""),
+                Factors=details.get("Factors", ""),
+                additional_notes=patient_data.description
+            )
+            for symptom in (symptoms or ["General"])
+        }
+    
+    return await register_patient(patient_data)
 
 @router.post("/patient/login", response_model=Token)
 async def login_patient(credentials: PatientLogin):
@@ -8,7 +8,8 @@ FIXED Language Routes - Addresses Detection Issues
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
+import asyncio
 import time
 
 router = APIRouter()
@@ -86,6 +87,11 @@ class TranslateRequest(BaseModel):
     source: Optional[str] = "auto"
     target: str = "en"
 
+class TranslateBatchRequest(BaseModel):
+    texts: List[str]
+    source: Optional[str] = "auto"
+    target: str = "en"
+
 
 def detect_script_type(text):
     """
@@ -171,9 +177,10 @@ async def detect_language(request: LanguageDetectRequest):
         # Set seed for consistent results
         DetectorFactory.seed = 0
         
-        # Detect with timeout protection
+        # Detect with timeout protection (in a worker thread - langdetect is CPU-bound
+        # and loads its language profiles on first use, which would stall the event loop)
         start_time = time.time()
-        detected = detect(text)
+        detected = await asyncio.to_thread(detect, text)
         elapsed = time.time() - start_time
         
         # ====================================================================
@@ -344,6 +351,69 @@ async def translate_text(request: TranslateRequest):
         raise HTTPException(status_code=500, detail=detail)
 
 
+def _translate_one(translator_cls, text, source, target):
+    """Blocking translation of one string (chunked past 4500 chars); original text on failure"""
+    if not text or not text.strip():
+        return text
+    try:
+        translator = translator_cls(source=source, target=target)
+        if len(text) > 4500:
+            return " ".join(
+                translator.translate(text[i:i+4500]) for i in range(0, len(text), 4500)
+            )
+        return translator.translate(text) or text
+    except Exception as e:
+        print(f"⚠️  Batch translation item failed: {e}")
+        return text
+
+
+@router.post("/translate-batch")
+async def translate_batch(request: TranslateBatchRequest):
+    """
+    Translate several strings in one round trip
+    Distinct texts are translated concurrently; a failed item comes back unchanged
+    """
+    if request.source == request.target and request.source != "auto":
+        return {
+            "translations": request.texts,
+            "source": request.source,
+            "target": request.target,
+            "skipped": True
+        }
+    
+    try:
+        from deep_translator import GoogleTranslator
+    except ImportError:
+        raise HTTPException(
+            status_code=503,
+            detail="Translation service not available"
+        )
+    
+    if request.target not in WELL_SUPPORTED_LANGUAGES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Target language '{request.target}' not supported"
+        )
+    
+    start_time = time.time()
+    unique = list(dict.fromkeys(request.texts))
+    results = await asyncio.gather(*(
+        asyncio.to_thread(_translate_one, GoogleTranslator, text, request.source, request.target)
+        for text in unique
+    ))
+    translated = dict(zip(unique, results))
+    elapsed = time.time() - start_time
+    
+    print(f"✅ Batch translation: {len(unique)} texts {request.source} -> {request.target} ({elapsed:.2f}s)")
+    
+    return {
+        "translations": [translated[text] for text in request.texts],
+        "source": request.source,
+        "target": request.target,
+        "elapsed_seconds": round(elapsed, 2)
+    }
+
+
 @router.get("/supported")
 async def get_supported_languages():
     """
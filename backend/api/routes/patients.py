@@ -3,12 +3,15 @@ Patient Routes - FIXED CLINICAL INSIGHTS
 Clinical insights now generate in background (no timeout!)
 """
 
-from fastapi import APIRouter, HTTPException, Depends, status, Response
+from fastapi import APIRouter, HTTPException, Depends, Request, status, Response
 from typing import List, Dict, Optional
 from bson import ObjectId
 from pydantic import BaseModel, Field, field_validator
+import asyncio
 import threading
 import time
+import hashlib
+from collections import OrderedDict
 from urllib.parse import quote
 import unicodedata
 import re
@@ -26,9 +29,24 @@ from api.middleware.auth import get_current_patient, get_current_doctor, hash_pa
 from core.database import db_manager
 from core.llm import llm_manager
 from utils.pdf_generator import generate_patient_pdf
+from utils.etag import etag_response, etag_matches
 
 router = APIRouter()
 
+# Partial clinical insights text per patient while the background LLM run is streaming
+_insights_partial: Dict[str, str] = {}
+
+# Rendered PDFs keyed by record version (LRU, bounded)
+PDF_CACHE_SIZE = 32
+_pdf_cache: "OrderedDict[str, bytes]" = OrderedDict()
+
+# Filename sanitizing patterns, compiled once at import
+UNSAFE_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+NON_ASCII_WORD_RE = re.compile(r'[^a-zA-Z0-9\s]')
+WHITESPACE_RE = re.compile(r'\s+')
+LATIN_RUN_RE = re.compile(r'[a-zA-Z0-9]+')
+NON_SLUG_RE = re.compile(r'[^a-z0-9_]')
+
 # Password change model
 class PasswordChange(BaseModel):
     current_password: str
@@ -74,7 +92,7 @@ def create_safe_filename(original_name: str, fallback: str = "Patient") -> tuple
     """
     
     # Clean the original name (remove unsafe characters)
-    unicode_filename = re.sub(r'[<>:"/\\|?*]', '', original_name)
+    unicode_filename = UNSAFE_FILENAME_RE.sub('', original_name)
     unicode_filename = unicode_filename.strip() or fallback
     
     # Create ASCII fallback using multiple strategies
@@ -109,8 +127,8 @@ def create_ascii_fallback(text: str, fallback: str = "Patient") -> str:
         ascii_text = ''.join(char for char in nfd if unicodedata.category(char) != 'Mn')
         
         # Keep only ASCII alphanumeric and spaces
-        ascii_text = re.sub(r'[^a-zA-Z0-9\s]', '', ascii_text)
-        ascii_text = re.sub(r'\s+', '_', ascii_text.strip())
+        ascii_text = NON_ASCII_WORD_RE.sub('', ascii_text)
+        ascii_text = WHITESPACE_RE.sub('_', ascii_text.strip())
         
         if ascii_text and len(ascii_text) >= 2:
             return ascii_text
@@ -122,8 +140,8 @@ def create_ascii_fallback(text: str, fallback: str = "Patient") -> str:
     try:
         from unidecode import unidecode
         transliterated = unidecode(text)
-        transliterated = re.sub(r'[^a-zA-Z0-9\s]', '', transliterated)
-        transliterated = re.sub(r'\s+', '_', transliterated.strip())
+        transliterated = NON_ASCII_WORD_RE.sub('', transliterated)
+        transliterated = WHITESPACE_RE.sub('_', transliterated.strip())
         
         if transliterated and len(transliterated) >= 2:
             return transliterated
@@ -134,7 +152,7 @@ def create_ascii_fallback(text: str, fallback: str = "Patient") -> str:
     
     # Step 3: Extract any Latin characters from mixed-script names
     # E.g., "李明 LiMing" → "LiMing"
-    latin_chars = re.findall(r'[a-zA-Z0-9]+', text)
+    latin_chars = LATIN_RUN_RE.findall(text)
     if latin_chars:
         extracted = '_'.join(latin_chars)
         if len(extracted) >= 2:
@@ -144,14 +162,62 @@ def create_ascii_fallback(text: str, fallback: str = "Patient") -> str:
     return fallback
 
 
-def create_download_response(pdf_buffer, patient_name: str, is_for_doctor: bool = False) -> Response:
+def pdf_version(patient: dict, is_for_doctor: bool) -> str:
+    """
+    Version hash of everything that goes into a patient's PDF
+    Hashes the stored (encrypted) fields - every update re-encrypts, so any change gives a new version
+    """
+    digest = hashlib.md5(b"doctor" if is_for_doctor else b"patient")
+    for field in ("demographic", "per_symptom", "Gen_questions", "summary"):
+        digest.update(repr(patient.get(field)).encode("utf-8"))
+    return digest.hexdigest()
+
+def render_patient_pdf(patient: dict, version: str):
+    """Return (pdf_bytes, patient_name, cache_hit), rendering only when this version is not cached"""
+    decrypted_demo = db_manager.decrypt_dict(patient["demographic"])
+    patient_name = decrypted_demo.get("name", "Patient")
+    
+    if version in _pdf_cache:
+        _pdf_cache.move_to_end(version)
+        return _pdf_cache[version], patient_name, True
+    
+    # Decrypt patient data
+    decrypted_data = {
+        "demographic": decrypted_demo,
+        "per_symptom": db_manager.decrypt_dict(patient["per_symptom"]),
+        "Gen_questions": db_manager.decrypt_dict(patient.get("Gen_questions", {}))
+    }
+    
+    if "summary" in patient:
+        try:
+            decrypted_data["summary"] = db_manager.decrypt_data(patient["summary"])
+        except:
+            decrypted_data["summary"] = None
+    
+    pdf_bytes = generate_patient_pdf(decrypted_data).getvalue()
+    
+    _pdf_cache[version] = pdf_bytes
+    if len(_pdf_cache) > PDF_CACHE_SIZE:
+        _pdf_cache.popitem(last=False)
+    
+    return pdf_bytes, patient_name, False
+
+def create_download_response(
+    pdf_bytes: bytes,
+    patient_name: str,
+    is_for_doctor: bool = False,
+    etag: Optional[str] = None,
+    cache_hit: bool = False
+) -> Response:
     """
     Create Response with proper Content-Disposition for all languages
     
     Args:
-        pdf_buffer: BytesIO buffer containing PDF
+        pdf_bytes: Rendered PDF content
         patient_name: Patient name in any language
         is_for_doctor: If True, adds "(Doctor_Copy)" to filename
+        etag: Optional ETag of the report version
+        cache_hit: Whether the PDF came from the render cache (X-Cache header)
     
     Returns:
         FastAPI Response with proper headers
@@ -181,10 +247,13 @@ def create_download_response(pdf_buffer, patient_name: str, is_for_doctor: bool
     headers = {
         "Content-Disposition": content_disposition,
         "Content-Type": "application/pdf",
+        "X-Cache": "HIT" if cache_hit else "MISS",
     }
+    if etag:
+        headers["ETag"] = etag
     
     return Response(
-        content=pdf_buffer.getvalue(),
+        content=pdf_bytes,
         media_type="application/pdf",
         headers=headers
     )
@@ -215,7 +284,7 @@ def sanitize_filename_ascii(filename: str) -> str:
         result = result.replace(char, replacement)
     
     # Keep only ASCII alphanumeric and underscores
-    result = re.sub(r'[^a-z0-9_]', '', result)
+    result = NON_SLUG_RE.sub('', result)
     
     # If nothing remains (e.g., all Hindi/Arabic/Chinese), use generic name
     if not result or len(result) < 2:
@@ -335,7 +404,7 @@ async def regenerate_summary(token_data: TokenData = Depends(get_current_patient
     return {"message": "Summary regeneration started"}
 
 @router.get("/me/pdf")
-async def download_my_pdf(token_data: TokenData = Depends(get_current_patient)):
+async def download_my_pdf(request: Request, token_data: TokenData = Depends(get_current_patient)):
     """Download patient's health report as PDF - UNIVERSAL LANGUAGE SUPPORT"""
     found_patient = None
     for patient in db_manager.patients.find():
@@ -353,28 +422,17 @@ async def download_my_pdf(token_data: TokenData = Depends(get_current_patient)):
             detail="Patient not found"
         )
     
-    # Decrypt patient data
-    decrypted_data = {
-        "demographic": db_manager.decrypt_dict(found_patient["demographic"]),
-        "per_symptom": db_manager.decrypt_dict(found_patient["per_symptom"]),
-        "Gen_questions": db_manager.decrypt_dict(found_patient.get("Gen_questions", {}))
-    }
+    # Unchanged record - the client already has this report
+    version = pdf_version(found_patient, is_for_doctor=False)
+    etag = f'W/"{version}"'
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
     
-    if "summary" in found_patient:
-        try:
-            decrypted_data["summary"] = db_manager.decrypt_data(found_patient["summary"])
-        except:
-            decrypted_data["summary"] = None
-    
-    # Generate PDF
-    from utils.pdf_generator import generate_patient_pdf
-    pdf_buffer = generate_patient_pdf(decrypted_data)
-    
-    # Get patient name (supports all languages)
-    patient_name = decrypted_data["demographic"].get("name", "Patient")
+    # Generate PDF (or reuse the cached render of this version)
+    pdf_bytes, patient_name, cache_hit = render_patient_pdf(found_patient, version)
     
     # Create response with universal filename support
-    return create_download_response(pdf_buffer, patient_name, is_for_doctor=False)
+    return create_download_response(pdf_bytes, patient_name, is_for_doctor=False, etag=etag, cache_hit=cache_hit)
 
 @router.put("/me/demographic")
 async def update_demographic(
@@ -500,6 +558,22 @@ async def update_health_questions(
     
     return {"message": "Health questions updated and summary regenerated successfully"}
 
+def symptoms_to_dict(per_symptom):
+    """Plain {symptom: details} dict from SymptomDetail models or raw dicts"""
+    per_symptom_dict = {}
+    for symptom_name, symptom_detail in per_symptom.items():
+        if isinstance(symptom_detail, SymptomDetail):
+            per_symptom_dict[symptom_name] = {
+                "Duration": symptom_detail.Duration or "",
+                "Severity": symptom_detail.Severity or "",
+                "Frequency": symptom_detail.Frequency or "",
+                "Factors": symptom_detail.Factors or "",
+                "Additional Notes": symptom_detail.additional_notes or ""
+            }
+        else:
+            per_symptom_dict[symptom_name] = symptom_detail
+    return per_symptom_dict
+
 @router.put("/me")
 async def update_patient(
     update_data: PatientUpdate,
@@ -528,25 +602,24 @@ async def update_patient(
         update_dict["demographic"] = db_manager.encrypt_dict(update_data.demographic.dict())
     
     if update_data.per_symptom:
-        per_symptom_dict = {}
-        for symptom_name, symptom_detail in update_data.per_symptom.items():
-            if isinstance(symptom_detail, SymptomDetail):
-                per_symptom_dict[symptom_name] = {
-                    "Duration": symptom_detail.Duration or "",
-                    "Severity": symptom_detail.Severity or "",
-                    "Frequency": symptom_detail.Frequency or "",
-                    "Factors": symptom_detail.Factors or "",
-                    "Additional Notes": symptom_detail.additional_notes or ""
-                }
-            else:
-                per_symptom_dict[symptom_name] = symptom_detail
-        
-        update_dict["per_symptom"] = db_manager.encrypt_dict(per_symptom_dict)
+        update_dict["per_symptom"] = db_manager.encrypt_dict(symptoms_to_dict(update_data.per_symptom))
+    
+    if update_data.per_symptom_patch:
+        # Merge patch: only the changed symptoms are encrypted, the rest are kept as stored
+        merged = dict(update_dict.get("per_symptom", found_patient.get("per_symptom", {})))
+        merged.update(db_manager.encrypt_dict(symptoms_to_dict(update_data.per_symptom_patch)))
+        update_dict["per_symptom"] = merged
     
     if update_data.gen_questions:
         update_dict["Gen_questions"] = db_manager.encrypt_dict(update_data.gen_questions)
     
-    if update_data.per_symptom or update_data.gen_questions:
+    if update_data.gen_questions_patch:
+        merged = dict(update_dict.get("Gen_questions", found_patient.get("Gen_questions", {})))
+        merged.update(db_manager.encrypt_dict(update_data.gen_questions_patch))
+        update_dict["Gen_questions"] = merged
+    
+    if (update_data.per_symptom or update_data.per_symptom_patch
+            or update_data.gen_questions or update_data.gen_questions_patch):
         current_data = {
             "demographic": db_manager.decrypt_dict(
                 update_dict.get("demographic", found_patient["demographic"])
@@ -617,15 +690,20 @@ async def analyze_symptoms(request: SymptomAnalysisRequest):
     print(f"\n🔍 ANALYZING SYMPTOMS: {request.description}")
     print(f"   Language: {request.source_language}")
     
+    # LLM calls are blocking - run them in a worker thread so the event loop
+    # keeps serving other requests while this analysis is in progress
+    
     # STEP 1: Identify symptoms
-    symptoms = llm_manager.identify_symptoms(
+    symptoms = await asyncio.to_thread(
+        llm_manager.identify_symptoms,
         request.description,
         source_lang=request.source_language
     )
     print(f"✅ Identified symptoms: {symptoms}")
     
     # STEP 2: Extract details
-    extracted_details = llm_manager.extract_symptom_details(
+    extracted_details = await asyncio.to_thread(
+        llm_manager.extract_symptom_details,
         request.description,
         source_lang=request.source_language
     )
@@ -634,7 +712,7 @@ async def analyze_symptoms(request: SymptomAnalysisRequest):
     # STEP 3: Generate follow-up questions
     questions = []
     if symptoms:
-        questions = llm_manager.generate_questions(symptoms[0], extracted_details)
+        questions = await asyncio.to_thread(llm_manager.generate_questions, symptoms[0], extracted_details)
         print(f"✅ Generated {len(questions)} follow-up questions")
     
     return SymptomAnalysisResponse(
@@ -646,9 +724,10 @@ async def analyze_symptoms(request: SymptomAnalysisRequest):
 @router.get("/{patient_id}", response_model=PatientResponse)
 async def get_patient_by_id(
     patient_id: str,
+    request: Request,
     token_data: TokenData = Depends(get_current_doctor)
 ):
-    """Get patient by ID (doctors only)"""
+    """Get patient by ID (doctors only) - ETag-revalidated, unchanged records return 304"""
     try:
         patient = db_manager.patients.find_one({"_id": ObjectId(patient_id)})
     except:
@@ -677,11 +756,12 @@ async def get_patient_by_id(
         except:
             decrypted_data["summary"] = None
     
-    return PatientResponse(**decrypted_data)
+    return etag_response(request, PatientResponse(**decrypted_data))
 
 @router.get("/{patient_id}/pdf")
 async def download_patient_pdf(
     patient_id: str,
+    request: Request,
     token_data: TokenData = Depends(get_current_doctor)
 ):
     """Download patient's PDF report (doctors only) - UNIVERSAL LANGUAGE SUPPORT"""
@@ -699,28 +779,17 @@ async def download_patient_pdf(
             detail="Patient not found"
         )
     
-    # Decrypt patient data
-    decrypted_data = {
-        "demographic": db_manager.decrypt_dict(patient["demographic"]),
-        "per_symptom": db_manager.decrypt_dict(patient["per_symptom"]),
-        "Gen_questions": db_manager.decrypt_dict(patient.get("Gen_questions", {}))
-    }
+    # Unchanged record - the client already has this report
+    version = pdf_version(patient, is_for_doctor=True)
+    etag = f'W/"{version}"'
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
     
-    if "summary" in patient:
-        try:
-            decrypted_data["summary"] = db_manager.decrypt_data(patient["summary"])
-        except:
-            decrypted_data["summary"] = None
-    
-    # Generate PDF
-    from utils.pdf_generator import generate_patient_pdf
-    pdf_buffer = generate_patient_pdf(decrypted_data)
-    
-    # Get patient name (supports all languages)
-    patient_name = decrypted_data["demographic"].get("name", "Patient")
+    # Generate PDF (or reuse the cached render of this version)
+    pdf_bytes, patient_name, cache_hit = render_patient_pdf(patient, version)
     
     # Create response with universal filename support (mark as doctor copy)
-    return create_download_response(pdf_buffer, patient_name, is_for_doctor=True)
+    return create_download_response(pdf_bytes, patient_name, is_for_doctor=True, etag=etag, cache_hit=cache_hit)
 
 
 # ============================================================================
@@ -795,8 +864,14 @@ async def request_clinical_insights(
                 "Gen_questions": db_manager.decrypt_dict(patient.get("Gen_questions", {}))
             }
             
-            # Generate insights (this takes 5-7 minutes with LLM)
-            insights = llm_manager.get_clinical_insights(patient_data)
+            # Generate insights (this takes 5-7 minutes with LLM), publishing
+            # partial text so status checks can show progress as it streams
+            _insights_partial[patient_id] = ""
+            
+            def publish_token(token):
+                _insights_partial[patient_id] = _insights_partial.get(patient_id, "") + token
+            
+            insights = llm_manager.get_clinical_insights(patient_data, on_token=publish_token)
             
             if insights:
                 # Update patient with insights when ready
@@ -824,6 +899,8 @@ async def request_clinical_insights(
                 {"_id": ObjectId(patient_id)},
                 {"$set": {"insights_status": "failed"}}
             )
+        finally:
+            _insights_partial.pop(patient_id, None)
     
     # Start background thread (daemon=True means it won't block shutdown)
     insights_thread = threading.Thread(target=generate_insights_background, daemon=True)
@@ -875,7 +952,8 @@ async def get_clinical_insights(
             "message": f"Insights are being generated... ({elapsed}s elapsed)",
             "patient_id": patient_id,
             "elapsed_seconds": elapsed,
-            "estimated_remaining": max(0, 420 - elapsed)  # 7 minutes = 420 seconds
+            "estimated_remaining": max(0, 420 - elapsed),  # 7 minutes = 420 seconds
+            "partial": _insights_partial.get(patient_id, "")
         }
     
     elif insights_status == "completed":
@@ -914,11 +992,12 @@ async def get_clinical_insights(
 
 @router.get("/", response_model=List[dict])
 async def list_patients(
+    request: Request,
     search_name: Optional[str] = None,
     search_email: Optional[str] = None,
     token_data: TokenData = Depends(get_current_doctor)
 ):
-    """List all patients with optional search (doctors only)"""
+    """List all patients with optional search (doctors only, supports If-None-Match)"""
     patients_list = []
     
     for patient in db_manager.patients.find():
@@ -942,4 +1021,4 @@ async def list_patients(
         except Exception as e:
             continue
     
-    return patients_list
\ No newline at end of file
+    return etag_response(request, patients_list)
\ No newline at end of file
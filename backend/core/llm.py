@@ -8,6 +8,34 @@ import os
 import re
 from core.config import settings
 
+# Regex fallback patterns for extract_symptom_details, compiled once at import
+DURATION_PATTERNS = [re.compile(p) for p in (
+    r'for\s+(?:the\s+)?(?:past\s+)?(?:last\s+)?(\d+\s+(?:day|days|week|weeks|month|months|year|years))',
+    r'(\d+\s+(?:day|days|week|weeks|month|months))\s+(?:now|ago)',
+    r'since\s+(yesterday|last\s+\w+|this\s+\w+)',
+    r'from\s+(?:the\s+)?(?:past\s+)?(?:last\s+)?(\d+\s+(?:day|days|week|weeks))',
+    r'(?:been|having|experiencing)\s+(?:this|it)\s+for\s+(\d+\s+(?:day|days|week|weeks))',
+)]
+SEVERITY_PATTERNS = [re.compile(p) for p in (
+    r'(\d+(?:\.\d+)?)\s*(?:out\s+of|/)\s*10',
+    r'severity\s+(?:is\s+)?(?:about\s+)?(\d+)',
+    r'\b(severe|mild|moderate|extreme|intense|terrible|unbearable|bad|very\s+bad)\b',
+    r'pain\s+(?:is\s+)?(?:about\s+)?(\d+)',
+)]
+FREQUENCY_PATTERNS = [re.compile(p) for p in (
+    r'(every\s+(?:day|morning|evening|night|hour|few\s+hours))',
+    r'(daily|hourly|constantly|frequently|occasionally)',
+    r'(\d+\s+times?\s+(?:a|per)\s+(?:day|week|hour))',
+    r'(all\s+day|throughout\s+the\s+day)',
+    r'(in\s+the\s+(?:morning|evening|night))',
+)]
+FACTOR_PATTERNS = [re.compile(p) for p in (
+    r'(?:worse|worsens?|triggered|aggravated)\s+(?:by|when|with|after)\s+([^.,!?]+)',
+    r'(?:especially|particularly)\s+(?:in|during|when|after)\s+([^.,!?]+)',
+    r'(?:caused|triggered)\s+by\s+([^.,!?]+)',
+    r'after\s+([^.,!?]+)',
+)]
+
 class LLMManager:
     """Manages LLM operations with enhanced multilingual support."""
     
@@ -17,6 +45,11 @@ class LLMManager:
         self.llm = None
         self.tokenizer = None
         self.symptoms_list = self._load_symptoms_from_knowledge_base()
+        # Word-boundary matchers for the keyword fallback, built once instead of per request
+        self.symptom_patterns = [
+            (symptom.lower().strip(), re.compile(r'\b' + re.escape(symptom.lower().strip()) + r'\b'))
+            for symptom in self.symptoms_list
+        ]
         
         # Try to initialize LLM if token provided
         if settings.USE_LLM and settings.HUGGING_FACE_TOKEN:
@@ -208,10 +241,8 @@ List ONLY medical symptoms, comma-separated, no other words:
         
         # STEP 2: Match against English symptom list
         matched_symptoms = []
-        for symptom in self.symptoms_list:
-            symptom_lower = symptom.lower().strip()
-            
-            if re.search(r'\b' + re.escape(symptom_lower) + r'\b', text_english):
+        for symptom_lower, pattern in self.symptom_patterns:
+            if pattern.search(text_english):
                 if symptom_lower not in matched_symptoms:
                     matched_symptoms.append(symptom_lower)
                     print(f"   ✅ Matched symptom: {symptom_lower}")
@@ -286,58 +317,32 @@ Extracted information:
                 print(f"   ✅ Will search in: {text_english[:100]}...")
         
         # Duration patterns
-        duration_patterns = [
-            r'for\s+(?:the\s+)?(?:past\s+)?(?:last\s+)?(\d+\s+(?:day|days|week|weeks|month|months|year|years))',
-            r'(\d+\s+(?:day|days|week|weeks|month|months))\s+(?:now|ago)',
-            r'since\s+(yesterday|last\s+\w+|this\s+\w+)',
-            r'from\s+(?:the\s+)?(?:past\s+)?(?:last\s+)?(\d+\s+(?:day|days|week|weeks))',
-            r'(?:been|having|experiencing)\s+(?:this|it)\s+for\s+(\d+\s+(?:day|days|week|weeks))',
-        ]
-        for pattern in duration_patterns:
-            match = re.search(pattern, text_english)
+        for pattern in DURATION_PATTERNS:
+            match = pattern.search(text_english)
             if match:
                 details["Duration"] = match.group(1).strip()
                 print(f"  ✅ Found duration: {details['Duration']}")
                 break
         
         # Severity patterns
-        severity_patterns = [
-            r'(\d+(?:\.\d+)?)\s*(?:out\s+of|/)\s*10',
-            r'severity\s+(?:is\s+)?(?:about\s+)?(\d+)',
-            r'\b(severe|mild|moderate|extreme|intense|terrible|unbearable|bad|very\s+bad)\b',
-            r'pain\s+(?:is\s+)?(?:about\s+)?(\d+)',
-        ]
-        for pattern in severity_patterns:
-            match = re.search(pattern, text_english)
+        for pattern in SEVERITY_PATTERNS:
+            match = pattern.search(text_english)
             if match:
                 details["Severity"] = match.group(1).strip()
                 print(f"  ✅ Found severity: {details['Severity']}")
                 break
         
         # Frequency patterns
-        frequency_patterns = [
-            r'(every\s+(?:day|morning|evening|night|hour|few\s+hours))',
-            r'(daily|hourly|constantly|frequently|occasionally)',
-            r'(\d+\s+times?\s+(?:a|per)\s+(?:day|week|hour))',
-            r'(all\s+day|throughout\s+the\s+day)',
-            r'(in\s+the\s+(?:morning|evening|night))',
-        ]
-        for pattern in frequency_patterns:
-            match = re.search(pattern, text_english)
+        for pattern in FREQUENCY_PATTERNS:
+            match = pattern.search(text_english)
             if match:
                 details["Frequency"] = match.group(1).strip()
                 print(f"  ✅ Found frequency: {details['Frequency']}")
                 break
         
         # Factors/Triggers
-        factor_patterns = [
-            r'(?:worse|worsens?|triggered|aggravated)\s+(?:by|when|with|after)\s+([^.,!?]+)',
-            r'(?:especially|particularly)\s+(?:in|during|when|after)\s+([^.,!?]+)',
-            r'(?:caused|triggered)\s+by\s+([^.,!?]+)',
-            r'after\s+([^.,!?]+)',
-        ]
-        for pattern in factor_patterns:
-            match = re.search(pattern, text_english)
+        for pattern in FACTOR_PATTERNS:
+            match = pattern.search(text_english)
             if match:
                 details["Factors"] = match.group(1).strip()
                 print(f"  ✅ Found factors: {details['Factors']}")
@@ -504,9 +509,10 @@ Clinical summary:
         
         return summary
     
-    def get_clinical_insights(self, patient_data):
+    def get_clinical_insights(self, patient_data, on_token=None):
         """
         FIXED: Generate comprehensive clinical insights for doctors
+        on_token(text) is called with each generated token so callers can show partial output
         """
         print(f"🧠 Generating clinical insights...")
         
@@ -543,7 +549,15 @@ Provide (keep under 200 words total):
 Clinical Insights:
 [/INST]"""
                 
-                insights = self.llm(prompt, max_new_tokens=300)
+                if on_token:
+                    # Stream tokens as they are produced, then assemble the full text
+                    parts = []
+                    for token in self.llm(prompt, max_new_tokens=300, stream=True):
+                        parts.append(token)
+                        on_token(token)
+                    insights = "".join(parts)
+                else:
+                    insights = self.llm(prompt, max_new_tokens=300)
                 
                 if insights and len(insights) > 50:
                     print(f"✅ Clinical insights generated ({len(insights)} chars)")
@@ -5,15 +5,23 @@ Handles all API routes and middleware
 
 from fastapi import FastAPI, HTTPException, Depends, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from contextlib import asynccontextmanager
 from utils.pdf_generator import generate_patient_pdf
 from api.routes import auth, patients, doctors, admin, language
+import asyncio
 import os
 from dotenv import load_dotenv
 import traceback
 from fastapi.exceptions import RequestValidationError
 
+# Optional C JSON encoder - route responses use it when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
@@ -42,7 +50,8 @@ app = FastAPI(
     title="Medical Health Assessment API",
     description="AI-powered health assessment and patient management system",
     version="2.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse if orjson else JSONResponse
 )
 
 # CORS middleware - MORE PERMISSIVE FOR DEVELOPMENT
@@ -54,6 +63,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Gzip JSON bodies (patient lists/details grow with the data) - tiny responses are sent as-is
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
@@ -138,12 +150,12 @@ async def root():
         "llm_available": llm_manager.is_available()
     }
 
-@app.get("/health")
+@app.api_route("/health", methods=["GET", "HEAD"])
 async def health_check():
-    """Health check endpoint for monitoring"""
+    """Health check endpoint for monitoring (HEAD for cheap liveness polls)"""
     try:
-        # Test database connection
-        db_manager.patients.find_one()
+        # Test database connection - a server ping, not a document read, off the event loop
+        await asyncio.to_thread(db_manager.client.admin.command, "ping")
         db_status = "connected"
     except Exception as e:
         db_status = f"error: {str(e)}"
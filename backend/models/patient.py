@@ -51,6 +51,12 @@ class PatientCreate(BaseModel):
             raise ValueError('Password must be at least 6 characters long')
         return v
 
+class PatientRegisterWithAnalysis(PatientCreate):
+    """Registration that also carries the free-text description for server-side analysis"""
+    per_symptom: Dict[str, SymptomDetail] = Field(default_factory=dict)
+    description: str = Field(..., min_length=1)
+    source_language: str = "auto"
+
 class PatientLogin(BaseModel):
     email: str
     password: str
@@ -77,7 +83,11 @@ class PatientResponse(BaseModel):
 class PatientUpdate(BaseModel):
     demographic: Optional[PatientDemographic] = None
     per_symptom: Optional[Dict[str, Union[SymptomDetail, Dict[str, Any]]]] = None
+    # Merge-patch alternative to per_symptom: only the listed symptoms are replaced
+    per_symptom_patch: Optional[Dict[str, Union[SymptomDetail, Dict[str, Any]]]] = None
     gen_questions: Optional[Dict[str, str]] = None
+    # Merge-patch alternative to gen_questions: only the listed answers are replaced
+    gen_questions_patch: Optional[Dict[str, str]] = None
     
     class Config:
         # Allow both Pydantic models and plain dicts for symptoms
@@ -0,0 +1,46 @@
+"""
+ETag helpers for read-only list endpoints
+Lets clients revalidate with If-None-Match and skip the body when nothing changed
+Tags are weak (W/"...") because GZipMiddleware may send the same content gzip-encoded
+"""
+
+import hashlib
+import json
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+# Optional C JSON encoder - same bytes as the stdlib call below, several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Weak If-None-Match comparison (RFC 9110): W/ prefixes are ignored, lists and * are honoured"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in header.split(","))
+
+
+def etag_response(request: Request, payload) -> Response:
+    """
+    JSON response carrying a weak ETag (md5 of the serialized body)
+    Returns 304 Not Modified with an empty body when If-None-Match matches
+    """
+    data = jsonable_encoder(payload)
+    if orjson:
+        body = orjson.dumps(data)
+    else:
+        body = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    etag = f'W/"{hashlib.md5(body).hexdigest()}"'
+
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
@@ -6,14 +6,72 @@ All CLI features restored with proper LLM integration
 import streamlit as st
 import requests
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.exceptions import ReadTimeoutError
 from requests.exceptions import RequestException
+import io
 import os
 import re
+import shutil
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional fast JSON encoder/decoder for API payloads
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to requests' stdlib json parser
 
 # Configuration
 API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000")
 
+# Doctor account status -> (icon, label), looked up instead of formatted per row
+STATUS_STYLE = {
+    "approved": ("🟢", "APPROVED"),
+    "pending": ("🔴", "PENDING"),
+    "disabled": ("🔴", "DISABLED"),
+    "rejected": ("🔴", "REJECTED"),
+}
+STATUS_DISPLAY = {status: f"{icon} {label}" for status, (icon, label) in STATUS_STYLE.items()}
+
+# General health questions shown on the patient Update tab
+GENERAL_QUESTIONS = (
+    "Do you have any chronic health conditions?",
+    "Are you currently taking any medications?",
+    "Have you had any surgeries in the past?",
+    "Do you have any allergies?",
+)
+
+# Symptom detail fields -> labels for the patient's Records tab
+SYMPTOM_FIELDS = (
+    ("Duration", "**Duration:**"),
+    ("Severity", "**Severity:**"),
+    ("Frequency", "**Frequency:**"),
+    ("Factors", "**Factors:**"),
+    ("Additional Notes", "**Notes:**"),
+)
+# Home page feature cards as one pre-joined block (one element instead of three columns)
+FEATURE_CARDS_HTML = (
+    '<div class="feature-row">'
+    '<div class="feature-card"><h3>🤖 AI Analysis</h3><p>Smart symptom detection</p></div>'
+    '<div class="feature-card"><h3>🔒 Encrypted</h3><p>AES-256 security</p></div>'
+    '<div class="feature-card"><h3>📄 PDF Reports</h3><p>Download reports</p></div>'
+    '</div>'
+)
+
+# Labels drawn on every render of the registration form - translated in one batch
+REGISTRATION_LABELS = (
+    "Personal Information", "Name", "Age", "Email", "Gender", "Male", "Female", "Other",
+    "Phone", "Password", "Describe Your Condition", "Tell us what you're experiencing",
+    "📋 Describe your condition - AI will understand!", "🔍 Analyze My Symptoms",
+    "General Health (Optional)", *GENERAL_QUESTIONS, "✅ Complete Registration",
+)
+
+# Form validation pattern, compiled once at import
+EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
 # Page config
 st.set_page_config(
     page_title="Health Assessment System",
@@ -23,43 +81,22 @@ st.set_page_config(
 )
 
 # Custom CSS
-st.markdown("""
-    <style>
-    .main-header {
-        font-size: 3rem;
-        color: #1f77b4;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    .sub-header {
-        font-size: 1.5rem;
-        color: #555;
-        text-align: center;
-        margin-bottom: 3rem;
-    }
-    .feature-card {
-        background-color: #f0f2f6;
-        padding: 1.5rem;
-        border-radius: 10px;
-        margin: 1rem 0;
-        color: #000000;
-    }
-    .feature-card h3 {
-    color: #1f77b4; /* heading color */
-    }
-    .feature-card p {
-        color: #333333; /* paragraph color */
-    }
-    .stButton>button {
-        width: 100%;
-        background-color: #1f77b4;
-        color: white;
-        border-radius: 5px;
-        padding: 0.5rem 1rem;
-        font-size: 1rem;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+@st.cache_resource
+def load_css():
+    """Page styles from static/app.css, read once per server process"""
+    css_path = os.path.join(os.path.dirname(__file__), "static", "app.css")
+    with open(css_path, encoding="utf-8") as f:
+        return f"<style>{f.read()}</style>"
+
+@st.cache_resource
+def load_icon():
+    """Sidebar logo (static/hospital.svg) as SVG markup - no third-party CDN request"""
+    icon_path = os.path.join(os.path.dirname(__file__), "static", "hospital.svg")
+    with open(icon_path, encoding="utf-8") as f:
+        return f.read()
+
+# Re-emitted every run - Streamlit drops elements a rerun does not send again
+st.markdown(load_css(), unsafe_allow_html=True)
 
 # Initialize session state
 if 'logged_in' not in st.session_state:
@@ -80,7 +117,335 @@ if 'detected_symptoms' not in st.session_state:
     st.session_state.detected_symptoms = []
 if 'chat_history' not in st.session_state:
     st.session_state.chat_history = []
+if 'pending_ops' not in st.session_state:
+    st.session_state.pending_ops = {}
+if 'profile_version' not in st.session_state:
+    st.session_state.profile_version = 0
+if 'list_version' not in st.session_state:
+    st.session_state.list_version = 0
+
+
+@st.cache_resource
+def get_adapter():
+    """
+    One connection pool to the backend shared by every session (all users and tokens)
+    Sessions come and go with logins, the open keep-alive connections stay
+    """
+    # Failed connects are retried for every method (nothing was sent yet); read errors and
+    # transient gateway errors only for idempotent requests (POSTs never are)
+    retries = Retry(
+        total=3,
+        connect=2,
+        read=1,
+        status=2,
+        backoff_factor=0.3,
+        status_forcelist=[429, 502, 503, 504],  # 429 waits out Retry-After
+        raise_on_status=False
+    )
+    return HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=50,
+        pool_block=False,
+        max_retries=retries
+    )
+
+
+# Connect timeout applied to every call - keeps connect retries from stacking into long hangs
+CONNECT_TIMEOUT = 3  # seconds
+
+# Circuit breaker: after this many failed connects in a row, fail fast for the cooldown
+CIRCUIT_MAX_FAILURES = 5
+CIRCUIT_COOLDOWN = 15  # seconds
+
+class BackendDown(requests.exceptions.ConnectionError):
+    """Raised without touching the network while the circuit breaker is open"""
+
+class JSONSession(requests.Session):
+    """
+    requests.Session that serializes json= payloads with orjson when installed,
+    applies a default (connect, read) timeout and trips a circuit breaker when
+    the backend cannot be reached, so buttons error out at once instead of hanging
+    Only connect failures count: the anonymous session is shared by every user,
+    and one user's slow reads must not lock everyone else out
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.failures = 0
+        self.opened_at = 0.0
+        self.breaker_lock = threading.Lock()  # Script threads of all users share the session
+    
+    def request(self, method, url, json=None, **kwargs):
+        with self.breaker_lock:
+            circuit_open = self.failures >= CIRCUIT_MAX_FAILURES and time.time() - self.opened_at < CIRCUIT_COOLDOWN
+        if circuit_open:
+            raise BackendDown("Backend unavailable - retrying shortly")
+        
+        # Call sites pass the read budget (timeout=10, or None for long analyses);
+        # the connect phase always gets the short limit
+        timeout = kwargs.get("timeout", 10)
+        if not isinstance(timeout, tuple):
+            kwargs["timeout"] = (CONNECT_TIMEOUT, timeout)
+        if json is not None and orjson:
+            kwargs["data"] = orjson.dumps(json)
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), "Content-Type": "application/json"}
+            json = None
+        
+        try:
+            resp = super().request(method, url, json=json, **kwargs)
+        except requests.exceptions.ConnectionError as e:
+            # Connect errors and connect timeouts (ConnectTimeout is a ConnectionError);
+            # read timeouts only mean a slow endpoint and are left to the caller -
+            # including retried ones, which requests wraps in a ConnectionError
+            reason = getattr(e.args[0], "reason", None) if e.args else None
+            if isinstance(reason, ReadTimeoutError):
+                raise
+            # After the cooldown one probe gets through; a failure re-opens the circuit
+            with self.breaker_lock:
+                self.failures += 1
+                if self.failures >= CIRCUIT_MAX_FAILURES:
+                    self.opened_at = time.time()
+            raise
+        
+        with self.breaker_lock:
+            self.failures = 0
+        return resp
+
+
+@st.cache_resource(max_entries=64)
+def get_session(token=None):
+    """
+    Shared HTTP session for API calls (one per access token)
+    Keeps connections to the backend alive across Streamlit reruns
+    """
+    session = JSONSession()
+    if token:
+        session.headers.update({"Authorization": f"Bearer {token}"})
+    session.mount(API_BASE_URL, get_adapter())
+    
+    # Warm-up: cheap HEAD /health opens the first pooled connection now so the first real call skips DNS/connect
+    try:
+        session.head(f"{API_BASE_URL}/health", timeout=(1, 2))
+    except RequestException:
+        pass
+    return session
+
+
+def parse_json(resp):
+    """Decode a JSON response body (orjson when installed, else requests' parser)"""
+    return orjson.loads(resp.content) if orjson else resp.json()
+
+
+@st.cache_resource
+def get_etag_store():
+    """
+    Last (ETag, body) seen per GET (lists and PDF reports) so repeat fetches are
+    revalidated with If-None-Match instead of downloading unchanged content again
+    """
+    return {}
+
+
+def remember_etag(key, etag, body, store=None):
+    """Store the latest (ETag, body) for a request key, evicting the oldest entry when full"""
+    if not etag:
+        return
+    if store is None:
+        store = get_etag_store()
+    if key not in store and len(store) >= 256:
+        store.pop(next(iter(store)))
+    store[key] = (etag, body)
+
+
+def get_json(session, store, url, token, params=()):
+    """
+    Conditional GET revalidated against the ETag store (no Streamlit calls,
+    so it also runs on prefetch worker threads)
+    Raises HTTPError on non-200
+    """
+    key = (url, token, params)
+    known = store.get(key)
+    headers = {"If-None-Match": known[0]} if known else {}
+    
+    resp = session.get(url, params=dict(params), headers=headers, timeout=10)
+    if resp.status_code == 304 and known:
+        return known[1]
+    resp.raise_for_status()
+    
+    body = parse_json(resp)
+    remember_etag(key, resp.headers.get("ETag"), body, store)
+    return body
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def fetch_json(url, token, params=(), version=0):
+    """
+    Cached GET for read-only list endpoints (keyed by URL, token, params and version)
+    Raises HTTPError on non-200 so failed responses are never cached
+    """
+    return get_json(get_session(token), get_etag_store(), url, token, params)
+
+
+@st.cache_resource
+def get_prefetch_pool():
+    """Worker threads for prefetches and background saves (shared by all sessions)"""
+    return ThreadPoolExecutor(max_workers=4)
+
+
+def prefetch_json(url, token):
+    """Start a background GET for a page the user is likely to open next"""
+    now = time.time()
+    # Keep only results that are still fresh enough to show
+    prefetched = {
+        u: entry for u, entry in st.session_state.get("prefetched", {}).items()
+        if now - entry[1] <= 30
+    }
+    if url not in prefetched:
+        future = get_prefetch_pool().submit(get_json, get_session(token), get_etag_store(), url, token)
+        prefetched[url] = (future, now)
+    st.session_state.prefetched = prefetched
+
+
+def fetch_json_prefetched(url, token):
+    """fetch_json, but picks up a fresh (< 30s) prefetch result when one is pending"""
+    entry = st.session_state.get("prefetched", {}).get(url)
+    if entry and time.time() - entry[1] <= 30:
+        return entry[0].result()
+    return fetch_json(url, token, version=st.session_state.list_version)
+
+@st.cache_data(ttl=300, max_entries=64, show_spinner=False)
+def fetch_profile(token, version=0):
+    """
+    Cached GET /api/patients/me for the logged-in patient (keyed by token and version)
+    The session's profile_version is bumped after every successful update and on
+    status polling, so the TTL is only a safety net for changes made elsewhere
+    """
+    resp = get_session(token).get(f"{API_BASE_URL}/api/patients/me", timeout=10)
+    resp.raise_for_status()
+    return parse_json(resp)
+
+@st.cache_data(ttl=300, max_entries=64, show_spinner=False)
+def fetch_doctor_profile(token):
+    """
+    Cached GET /api/doctors/me for the logged-in doctor (keyed by token)
+    Raises HTTPError on non-200 so failed responses are never cached
+    """
+    resp = get_session(token).get(f"{API_BASE_URL}/api/doctors/me", timeout=10)
+    resp.raise_for_status()
+    return parse_json(resp)
+
+@st.cache_data(ttl=30, show_spinner=False)
+def fetch_batch(paths, token, version=0):
+    """
+    Cached batch of read-only admin GETs in one round trip via /api/admin/_batch (keyed by version too)
+    Returns {path: {status_code, body}} for each requested path
+    """
+    resp = get_session(token).post(
+        f"{API_BASE_URL}/api/admin/_batch",
+        json={"requests": [{"method": "GET", "path": path} for path in paths]},
+        timeout=15
+    )
+    resp.raise_for_status()
+    return {r["path"]: r for r in parse_json(resp)["responses"]}
+
+@st.cache_data(ttl=3600, max_entries=128, show_spinner=False)
+def load_insights(patient_id, token, generation=0):
+    """
+    Completed clinical insights for a patient (bounded cache keyed by patient, token and generation)
+    Raises if the insights are not ready so unfinished results are never cached
+    """
+    resp = get_session(token).get(
+        f"{API_BASE_URL}/api/patients/{patient_id}/clinical-insights",
+        timeout=10
+    )
+    resp.raise_for_status()
+    data = parse_json(resp)
+    if data.get("status") != "completed":
+        raise ValueError(f"Insights not ready: {data.get('status')}")
+    return data["insights"]
+
+@st.cache_data(ttl=60, show_spinner=False)
+def fetch_llm_available():
+    """
+    Whether the backend has its LLM enabled (API root info, shared by every dashboard)
+    Raises on failure so a transient error is not cached as 'unavailable'
+    """
+    resp = get_session().get(f"{API_BASE_URL}/", timeout=5)
+    resp.raise_for_status()
+    return parse_json(resp).get("llm_available", False)
 
+def llm_enabled():
+    """fetch_llm_available with the old fallback - treat any failure as no LLM"""
+    try:
+        return fetch_llm_available()
+    except Exception:
+        return False
+
+
+@st.cache_data(ttl=86400, max_entries=2048, show_spinner=False)
+def _translate_cached(text, target_lang, source_lang):
+    """
+    Memoized call to /api/language/translate (UI strings repeat across reruns)
+    Raises on failure so fallbacks are never cached
+    """
+    resp = get_session().post(
+        f"{API_BASE_URL}/api/language/translate",
+        json={
+            "text": text,
+            "source": source_lang,
+            "target": target_lang
+        },
+        timeout=15  # Increased from default 5s
+    )
+    resp.raise_for_status()
+    return parse_json(resp).get("translated", text)
+
+@st.cache_data(ttl=86400, max_entries=256, show_spinner=False)
+def _translate_batch_cached(texts, target_lang, source_lang):
+    """
+    Memoized call to /api/language/translate-batch (one round trip for many strings)
+    Raises on failure so fallbacks are never cached
+    """
+    resp = get_session().post(
+        f"{API_BASE_URL}/api/language/translate-batch",
+        json={
+            "texts": list(texts),
+            "source": source_lang,
+            "target": target_lang
+        },
+        timeout=30
+    )
+    resp.raise_for_status()
+    return parse_json(resp).get("translations", list(texts))
+
+def translate_batch(texts, target_lang='en', source_lang='en'):
+    """
+    Translate a list of strings in one request
+    Falls back to the originals (per item and on any failure)
+    """
+    texts = list(texts)
+    if not texts or target_lang == 'en':
+        return texts
+    
+    try:
+        translated = _translate_batch_cached(tuple(texts), target_lang, source_lang)
+        return [t or original for t, original in zip(translated, texts)]
+    
+    except requests.exceptions.HTTPError as e:
+        print(f"⚠️  Batch translation failed: {e.response.status_code}")
+        return texts
+    
+    except requests.exceptions.Timeout:
+        print("⚠️  Batch translation timeout - using original text")
+        return texts
+    
+    except requests.exceptions.ConnectionError:
+        print("⚠️  Translation service unavailable - using original text")
+        return texts
+    
+    except (RequestException, ValueError) as e:
+        # Other request failures or an unreadable body - programming errors still raise
+        print(f"⚠️  Batch translation error: {str(e)} - using original text")
+        return texts
 
 def translate_text(text, target_lang='en', source_lang='auto'):
     """
@@ -91,24 +456,12 @@ def translate_text(text, target_lang='en', source_lang='auto'):
         return text
     
     try:
-        # ✅ FIX: Increase timeout to 15 seconds
-        resp = requests.post(
-            f"{API_BASE_URL}/api/language/translate",
-            json={
-                "text": text,
-                "source": source_lang,
-                "target": target_lang
-            },
-            timeout=15  # Increased from default 5s
-        )
-        
-        if resp.status_code == 200:
-            data = resp.json()
-            return data.get("translated", text)
-        else:
-            # Log error but don't break UI
-            print(f"⚠️  Translation failed: {resp.status_code}")
-            return text  # Return original text as fallback
+        return _translate_cached(text, target_lang, source_lang)
+    
+    except requests.exceptions.HTTPError as e:
+        # Log error but don't break UI
+        print(f"⚠️  Translation failed: {e.response.status_code}")
+        return text  # Return original text as fallback
     
     except requests.exceptions.Timeout:
         # ✅ FIX: Don't show error, just use original text
@@ -119,10 +472,26 @@ def translate_text(text, target_lang='en', source_lang='auto'):
         print("⚠️  Translation service unavailable - using original text")
         return text
     
-    except Exception as e:
+    except (RequestException, ValueError) as e:
+        # Other request failures or an unreadable body - programming errors still raise
         print(f"⚠️  Translation error: {str(e)} - using original text")
         return text
 
+@st.cache_data(ttl=600, max_entries=256, show_spinner=False)
+def detect_language(text):
+    """
+    Memoized call to /api/language/detect
+    The auto-check and the Analyze button send the same text, so the second is free
+    Raises on failure so errors are never cached
+    """
+    resp = get_session().post(
+        f"{API_BASE_URL}/api/language/detect",
+        json={"text": text},
+        timeout=10
+    )
+    resp.raise_for_status()
+    return parse_json(resp)
+
 
 def detect_and_confirm_language(text, field_name=""):
         """Detect language from text and show confirmation dialog"""
@@ -130,30 +499,24 @@ def detect_and_confirm_language(text, field_name=""):
             return False
         
         try:
-            resp = requests.post(
-                f"{API_BASE_URL}/api/language/detect",
-                json={"text": text},
-                timeout=10
-            )
+            data = detect_language(text)
+            detected = data["detected"]
+            lang_name = data["language_name"]
+            confidence = data.get("confidence", "low")
             
-            if resp.status_code == 200:
-                data = resp.json()
-                detected = data["detected"]
-                lang_name = data["language_name"]
-                confidence = data.get("confidence", "low")
-                
-                # Only prompt if high confidence and different from current
-                if confidence == "high" and detected != st.session_state.current_language:
-                    st.session_state.pending_language_change = {
-                        "code": detected,
-                        "name": lang_name,
-                        "triggered_by": field_name
-                    }
-                    return True
-            else:
-                # ✅ FIX: Don't show error, just skip detection
-                print(f"⚠️  Language detection returned {resp.status_code}")
-                return False
+            # Only prompt if high confidence and different from current
+            if confidence == "high" and detected != st.session_state.current_language:
+                st.session_state.pending_language_change = {
+                    "code": detected,
+                    "name": lang_name,
+                    "triggered_by": field_name
+                }
+                return True
+        
+        except requests.exceptions.HTTPError as e:
+            # ✅ FIX: Don't show error, just skip detection
+            print(f"⚠️  Language detection returned {e.response.status_code}")
+            return False
         
         except requests.exceptions.Timeout:
             # ✅ FIX: Silent timeout - don't disrupt user experience
@@ -164,7 +527,8 @@ def detect_and_confirm_language(text, field_name=""):
             print("⚠️  Language detection service unavailable")
             return False
         
-        except Exception as e:
+        except (RequestException, ValueError, KeyError) as e:
+            # Other request failures or a malformed detection result
             print(f"⚠️  Language detection error: {str(e)}")
             return False
         
@@ -193,6 +557,57 @@ def render_language_confirmation():
                 st.info("Continuing in current language")
                 st.rerun()
 
+def retranslate_analysis(new_lang):
+    """Re-translate a stored registration analysis into the new UI language (one batched request)"""
+    analysis = st.session_state.get("analysis_result")
+    if not analysis:
+        return
+    
+    symptoms = analysis.get("symptoms") or []
+    questions = analysis.get("questions") or []
+    translated = translate_batch(symptoms + questions, target_lang=new_lang, source_lang="en")
+    if symptoms:
+        analysis["symptoms_translated"] = translated[:len(symptoms)]
+    if questions:
+        analysis["questions_translated"] = translated[len(symptoms):]
+
+def switch_language(new_lang, notice):
+    """
+    Button callback: switch the UI language before the script reruns
+    The page redraws once in the new language - no sleep, no extra st.rerun()
+    """
+    st.session_state.current_language = new_lang
+    st.session_state.pending_language_change = None
+    retranslate_analysis(new_lang)
+    st.session_state.language_notice = notice
+
+def dismiss_language_change():
+    """Button callback: keep the current language"""
+    st.session_state.pending_language_change = None
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_supported_languages():
+    """
+    Supported language list (changes only on backend deploys, so cached for an hour)
+    Raises HTTPError on non-200 so failures are never cached
+    """
+    resp = get_session().get(f"{API_BASE_URL}/api/language/supported", timeout=10)
+    resp.raise_for_status()
+    return parse_json(resp)["languages"]
+
+@st.cache_resource(ttl=3600)
+def language_tables():
+    """
+    Lookup tables built once from the supported-language list:
+    name -> code, code -> name, the ordered selectbox names and name -> index
+    """
+    langs = fetch_supported_languages()
+    name_to_code = {l["name"]: l["code"] for l in langs}
+    code_to_name = {code: name for name, code in name_to_code.items()}
+    names = list(name_to_code)
+    name_to_idx = {name: i for i, name in enumerate(names)}
+    return name_to_code, code_to_name, names, name_to_idx
+
 def render_language_selector():
     """Manual language selector in sidebar"""
     with st.sidebar:
@@ -200,20 +615,14 @@ def render_language_selector():
         st.markdown("### 🌐 Language")
         
         try:
-            resp = requests.get(f"{API_BASE_URL}/api/language/supported")
-            if resp.status_code == 200:
-                langs = resp.json()["languages"]
-                lang_dict = {l["name"]: l["code"] for l in langs}
-                
-                current_name = next(
-                    (n for n, c in lang_dict.items() if c == st.session_state.current_language),
-                    "English"
-                )
+            lang_dict, code_to_name, names, name_to_idx = language_tables()
+            if names:
+                current_name = code_to_name.get(st.session_state.current_language, "English")
                 
                 selected = st.selectbox(
                     "Select:",
-                    options=list(lang_dict.keys()),
-                    index=list(lang_dict.keys()).index(current_name)
+                    options=names,
+                    index=name_to_idx.get(current_name, 0)
                 )
                 
                 if lang_dict[selected] != st.session_state.current_language:
@@ -226,18 +635,59 @@ def render_language_selector():
 
 def validate_email(email):
     """Validate email format"""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return EMAIL_RE.match(email) is not None
 
 def validate_phone(phone):
-    """Validate phone format (10+ digits)"""
-    digits = re.sub(r'\D', '', phone)
-    return len(digits) >= 10
+    """Validate phone format (10+ digits) - counts digits in one C-level pass, no stripped copy"""
+    return sum(map(str.isdecimal, phone)) >= 10
+
+def validate_pwd(current_pwd, new_pwd, confirm_pwd):
+    """Validate a change-password form, returning an error message or None"""
+    if not all([current_pwd, new_pwd, confirm_pwd]):
+        return "❌ Please fill all fields"
+    if len(new_pwd) < 6:
+        return "❌ Password must be at least 6 characters"
+    if new_pwd != confirm_pwd:
+        return "❌ Passwords don't match"
+    return None
+
+def parse_batch_error(result, fallback):
+    """User-friendly message for a failed entry of a batched response"""
+    detail = result.get("body", {}).get("detail") if isinstance(result.get("body"), dict) else None
+    return f"❌ {detail}" if isinstance(detail, str) else f"❌ {fallback}"
+
+# Friendly messages for 422 validation errors, keyed by the failing field
+FIELD_ERRORS = {
+    "email": "❌ Invalid email format. Use: user@example.com",
+    "password": "❌ Password must be at least 6 characters",
+    "new_password": "❌ Password must be at least 6 characters",
+    "current_password": "❌ Password must be at least 6 characters",
+    "phone": "❌ Invalid phone (need 10+ digits)",
+    "age": "❌ Age must be a number between 0 and 150",
+    "name": "❌ Name must be 2-100 characters",
+    "gender": "❌ Please select a gender",
+    "description": "❌ Please describe your symptoms in more detail",
+}
+
+# Locations that name the whole body/model rather than one field
+MODEL_LOCS = {"", "body", "__root__"}
+
+# Fallback messages when the error body can't be parsed
+STATUS_ERRORS = {
+    400: "❌ Invalid request. Check your input.",
+    401: "❌ Authentication failed. Login again.",
+    403: "❌ Access denied.",
+    404: "❌ Resource not found.",
+    409: "❌ Data already exists.",
+    422: "❌ Invalid data format.",
+    500: "❌ Server error. Try again later.",
+    503: "❌ Service unavailable."
+}
 
 def parse_api_error(response):
     """Parse API error and return user-friendly message"""
     try:
-        error_data = response.json()
+        error_data = parse_json(response)
         
         # Handle validation errors (422)
         if response.status_code == 422:
@@ -247,16 +697,21 @@ def parse_api_error(response):
                 if isinstance(details, list):
                     for error in details:
                         if isinstance(error, dict):
-                            field = error.get('loc', [''])[-1] if error.get('loc') else ''
-                            msg = error.get('msg', '')
+                            # Innermost named field - nested locs look like
+                            # ['body', 'demographic', 'phone'] or end in a list index
+                            names = [str(part) for part in error.get('loc') or [] if isinstance(part, str)]
+                            field = names[-1] if names else ''
                             
                             # User-friendly messages
-                            if 'email' in field.lower():
-                                return "❌ Invalid email format. Use: user@example.com"
-                            elif 'password' in field.lower():
-                                return "❌ Password must be at least 6 characters"
-                            elif msg:
-                                return f"❌ {field.capitalize()}: {msg}"
+                            friendly = FIELD_ERRORS.get(field)
+                            if friendly:
+                                return friendly
+                            msg = error.get('msg', '')
+                            if msg and field in MODEL_LOCS:
+                                # Model-level error - the message already says what is wrong
+                                return f"❌ {msg.removeprefix('Value error, ')}"
+                            if msg:
+                                return f"❌ {field.replace('_', ' ').capitalize()}: {msg}"
                     return "❌ Please check your input"
                 
                 elif isinstance(details, str):
@@ -269,75 +724,131 @@ def parse_api_error(response):
                 
                 if isinstance(detail, str):
                     # Make common errors friendly
-                    if 'already exists' in detail.lower():
+                    lowered = detail.lower()
+                    if 'already exists' in lowered:
                         return "❌ Email already registered. Try logging in."
-                    elif 'not found' in detail.lower():
+                    elif 'not found' in lowered:
                         return "❌ Account not found. Check your credentials."
-                    elif 'invalid' in detail.lower() and 'password' in detail.lower():
+                    elif 'invalid' in lowered and 'password' in lowered:
                         return "❌ Invalid email or password."
-                    elif 'pending approval' in detail.lower():
+                    elif 'pending approval' in lowered:
                         return "⏳ Account pending admin approval."
-                    elif 'unauthorized' in detail.lower():
+                    elif 'unauthorized' in lowered:
                         return "❌ Unauthorized. Please login again."
                     else:
                         return f"❌ {detail}"
         
         return "❌ An error occurred. Please try again."
     
-    except:
-        # Fallback based on status code
-        error_messages = {
-            400: "❌ Invalid request. Check your input.",
-            401: "❌ Authentication failed. Login again.",
-            403: "❌ Access denied.",
-            404: "❌ Resource not found.",
-            409: "❌ Data already exists.",
-            422: "❌ Invalid data format.",
-            500: "❌ Server error. Try again later.",
-            503: "❌ Service unavailable."
-        }
-        return error_messages.get(response.status_code, f"❌ Error {response.status_code}")
+    except ValueError:
+        # Body is not JSON (proxy error page, empty body) - fall back on the status code
+        return STATUS_ERRORS.get(response.status_code, f"❌ Error {response.status_code}")
 
-def check_api_health():
-    """Check if API is accessible with error handling"""
+def ping_health(session):
+    """Single HEAD /health - True when the backend answers 200 (no body to download)"""
     try:
-        response = requests.get(f"{API_BASE_URL}/health", timeout=5)
+        response = session.head(f"{API_BASE_URL}/health", timeout=(1, 2))
         return response.status_code == 200
-    except requests.exceptions.Timeout:
-        return False
-    except requests.exceptions.ConnectionError:
-        return False
-    except Exception:
+    except requests.exceptions.RequestException:
         return False
 
+@st.cache_resource
+def get_health_monitor():
+    """
+    Background thread polling /health every 10s (one per server process)
+    Reruns read the last result instead of waiting on the network
+    """
+    session = requests.Session()
+    session.mount(API_BASE_URL, get_adapter())
+    state = {"ok": None, "session": session}
+    
+    def poll():
+        while True:
+            state["ok"] = ping_health(session)
+            time.sleep(10)
+    
+    threading.Thread(target=poll, name="api-health", daemon=True).start()
+    return state
+
+def check_api_health():
+    """Check if API is accessible (last background result; blocks only before the first poll)"""
+    ok = get_health_monitor()["ok"]
+    if ok is None:
+        return ping_health(get_session())
+    return ok
+
+def recheck_api_health():
+    """Ping /health right away instead of waiting for the next background poll"""
+    monitor = get_health_monitor()
+    monitor["ok"] = ping_health(monitor["session"])  # Plain session - not held back by the circuit breaker
+
+def invalidate_profile():
+    """Bump this session's profile version so the profile and PDF are refetched"""
+    st.session_state.profile_version += 1
+
 def logout():
     """Logout user"""
+    invalidate_profile()
     st.session_state.logged_in = False
     st.session_state.user_type = None
     st.session_state.access_token = None
     st.session_state.user_email = None
     st.session_state.chat_history = []
+    st.session_state.selected_patient_id = None
+    st.session_state.pending_ops = {}
+    st.session_state.pending_update = None
     st.success("Logged out successfully!")
     st.rerun()
 
-def download_pdf(patient_id=None):
-    """Download PDF report with error handling"""
-    headers = {"Authorization": f"Bearer {st.session_state.access_token}"}
+@st.cache_data(ttl=300, max_entries=8, show_spinner=False)
+def _download_pdf_cached(patient_id, token, version=0):
+    """
+    PDF report bytes per (patient, token, version), streamed from the backend
+    Revalidates with the stored ETag so an unchanged report comes back as 304
+    Raises HTTPError on failure so errors are never cached
+    """
+    if patient_id:
+        url = f"{API_BASE_URL}/api/patients/{patient_id}/pdf"
+    else:
+        url = f"{API_BASE_URL}/api/patients/me/pdf"
     
-    try:
-        if patient_id:
-            url = f"{API_BASE_URL}/api/patients/{patient_id}/pdf"
-        else:
-            url = f"{API_BASE_URL}/api/patients/me/pdf"
+    key = (url, token)
+    known = get_etag_store().get(key)
+    # PDFs are already compressed - skip gzip on the way back
+    headers = {"Accept-Encoding": "identity"}
+    if known:
+        headers["If-None-Match"] = known[0]
+    
+    with get_session(token).get(url, headers=headers, stream=True, timeout=30) as response:
+        if response.status_code == 304 and known:
+            return known[1]
+        if response.status_code != 200:
+            response.content  # Read the error body before the stream is closed
+            response.raise_for_status()
         
-        response = requests.get(url, headers=headers, timeout=30)
+        # Copy straight from the socket into one buffer - no per-chunk Python loop
+        buffer = io.BytesIO()
+        response.raw.decode_content = True
+        shutil.copyfileobj(response.raw, buffer, 65536)
+        pdf_bytes = buffer.getvalue()
         
-        if response.status_code == 200:
-            return response.content
-        else:
-            st.error(parse_api_error(response))
-            return None
+        remember_etag(key, response.headers.get("ETag"), pdf_bytes)
+    
+    return pdf_bytes
+
+def download_pdf(patient_id=None):
+    """
+    Download PDF report with error handling
+    Returns a BytesIO that st.download_button accepts directly
+    """
+    try:
+        return io.BytesIO(_download_pdf_cached(
+            patient_id, st.session_state.access_token, st.session_state.profile_version
+        ))
     
+    except requests.exceptions.HTTPError as e:
+        st.error(parse_api_error(e.response))
+        return None
     except requests.exceptions.Timeout:
         st.error("⏱️ PDF generation timed out. Try again.")
         return None
@@ -356,12 +867,13 @@ def main():
     api_status = check_api_health()
     if not api_status:
         st.error("⚠️ Cannot connect to backend API")
+        st.button("🔄 Recheck connection", on_click=recheck_api_health)
         return
     
     st.success("✅ Backend API connected!")
     
     with st.sidebar:
-        st.image("https://cdn-icons-png.flaticon.com/512/2913/2913133.png", width=100)
+        st.image(load_icon(), width=100)
         st.title("Navigation")
         if st.session_state.logged_in:
             st.info(f"**{st.session_state.user_type.upper()}**")
@@ -379,13 +891,7 @@ def main():
 def show_home_page():
     """Show home page"""
     st.markdown("### 🌟 Key Features")
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.markdown('<div class="feature-card"><h3>🤖 AI Analysis</h3><p>Smart symptom detection</p></div>', unsafe_allow_html=True)
-    with col2:
-        st.markdown('<div class="feature-card"><h3>🔒 Encrypted</h3><p>AES-256 security</p></div>', unsafe_allow_html=True)
-    with col3:
-        st.markdown('<div class="feature-card"><h3>📄 PDF Reports</h3><p>Download reports</p></div>', unsafe_allow_html=True)
+    st.markdown(FEATURE_CARDS_HTML, unsafe_allow_html=True)
     
     st.markdown("---")
     tab1, tab2, tab3, tab4 = st.tabs(["👤 Patient Login", "👨‍⚕️ Staff Login", "📝 Register", "👨‍⚕️ Staff Register"])
@@ -420,18 +926,19 @@ def show_patient_login():
             # API call with error handling
             with st.spinner("Logging in..."):
                 try:
-                    response = requests.post(
+                    response = get_session().post(
                         f"{API_BASE_URL}/api/auth/patient/login",
                         json={"email": email, "password": password},
                         timeout=10
                     )
                     
                     if response.status_code == 200:
-                        data = response.json()
+                        data = parse_json(response)
                         st.session_state.logged_in = True
                         st.session_state.user_type = "patient"
                         st.session_state.access_token = data["access_token"]
                         st.session_state.user_email = email
+                        get_session(data["access_token"])  # Warm the pooled connection during the pause below
                         st.success("✅ Login successful!")
                         time.sleep(1)
                         st.rerun()
@@ -467,18 +974,19 @@ def show_staff_login():
             
             with st.spinner("Authenticating..."):
                 try:
-                    response = requests.post(
+                    response = get_session().post(
                         f"{API_BASE_URL}/api/auth/{endpoint}/login",
                         json={"email": email, "password": password},
                         timeout=10
                     )
                     
                     if response.status_code == 200:
-                        data = response.json()
+                        data = parse_json(response)
                         st.session_state.logged_in = True
                         st.session_state.user_type = endpoint
                         st.session_state.access_token = data["access_token"]
                         st.session_state.user_email = email
+                        get_session(data["access_token"])  # Warm the pooled connection during the pause below
                         st.success("✅ Login successful!")
                         time.sleep(1)
                         st.rerun()
@@ -531,6 +1039,11 @@ def show_patient_registration():
     # ============================================================
     # ✅ FIX: LANGUAGE CONFIRMATION DIALOG (RENDERED FIRST)
     # ============================================================
+    # Result of a language switch made in a button callback during this rerun
+    language_notice = st.session_state.pop("language_notice", None)
+    if language_notice:
+        st.success(language_notice)
+    
     if st.session_state.pending_language_change:
         lang_info = st.session_state.pending_language_change
         
@@ -540,157 +1053,87 @@ def show_patient_registration():
         col1, col2 = st.columns(2)
         
         with col1:
-            if st.button(
+            st.button(
                 f"✅ Yes, switch to {lang_info['name']}", 
                 use_container_width=True,
-                key="accept_lang_change"
-            ):
-                old_lang = st.session_state.current_language
-                new_lang = lang_info['code']
-                
-                st.session_state.current_language = new_lang
-                st.session_state.pending_language_change = None
-                
-                # Re-translate existing analysis if present
-                if st.session_state.get("analysis_result"):
-                    analysis = st.session_state.analysis_result
-                    
-                    # Translate symptoms
-                    if analysis.get('symptoms') and new_lang != 'en':
-                        try:
-                            translated_symptoms = []
-                            for sym in analysis['symptoms']:
-                                translated = translate_text(sym, target_lang=new_lang, source_lang='en')
-                                translated_symptoms.append(translated)
-                            analysis['symptoms_translated'] = translated_symptoms
-                        except Exception as e:
-                            print(f"Error translating symptoms: {e}")
-                    elif new_lang == 'en':
-                        analysis['symptoms_translated'] = analysis.get('symptoms', [])
-                    
-                    # Translate questions
-                    if analysis.get('questions') and new_lang != 'en':
-                        try:
-                            translated_questions = []
-                            for q in analysis['questions']:
-                                translated = translate_text(q, target_lang=new_lang, source_lang='en')
-                                translated_questions.append(translated)
-                            analysis['questions_translated'] = translated_questions
-                        except Exception as e:
-                            print(f"Error translating questions: {e}")
-                    elif new_lang == 'en':
-                        analysis['questions_translated'] = analysis.get('questions', [])
-                    
-                    st.session_state.analysis_result = analysis
-                
-                st.success(f"✅ Switched to {lang_info['name']}!")
-                st.info("💾 All your entered data has been preserved")
-                time.sleep(1.5)
-                st.rerun()
+                key="accept_lang_change",
+                on_click=switch_language,
+                args=(lang_info['code'], f"✅ Switched to {lang_info['name']}! 💾 All your entered data has been preserved")
+            )
         
         with col2:
-            if st.button(
+            st.button(
                 "❌ No, keep current language", 
                 use_container_width=True,
-                key="reject_lang_change"
-            ):
-                st.session_state.pending_language_change = None
-                st.info("Continuing in current language")
-                time.sleep(0.5)
-                st.rerun()
+                key="reject_lang_change",
+                on_click=dismiss_language_change
+            )
         
         st.markdown("---")
 
     # ============================================================
     # HELPER FUNCTIONS
     # ============================================================
+    # The form's fixed labels come back from one batched request (translated
+    # concurrently server-side) instead of one sequential call per label
+    batch_labels = {}
+    if st.session_state.current_language != 'en':
+        batch_labels = dict(zip(
+            REGISTRATION_LABELS,
+            translate_batch(REGISTRATION_LABELS, st.session_state.current_language, source_lang='en')
+        ))
+    
     def get_label(english_text):
         """
         Get translated label with safe fallback
         Returns English if translation fails or times out
+        Results are kept in batch_labels, so a label repeated in this run
+        (per-symptom fields, gender options) is a plain dict lookup
         """
-        if st.session_state.current_language == 'en':
+        if not batch_labels:
             return english_text
         
-        # Try translation with fallback
-        try:
-            translated = translate_text(
-                english_text,
-                st.session_state.current_language,
-                source_lang='en'
-            )
-            # Return translated ONLY if it's valid and different from original
-            if translated and translated.strip() and translated != english_text:
-                return translated
-        except:
-            pass
-        
-        # Fallback to English
-        return english_text
+        label = batch_labels.get(english_text)
+        if label is None:
+            label = english_text
+            # Try translation with fallback
+            try:
+                translated = translate_text(
+                    english_text,
+                    st.session_state.current_language,
+                    source_lang='en'
+                )
+                # Use translated ONLY if it's valid
+                if translated and translated.strip():
+                    label = translated
+            except Exception:
+                pass
+            batch_labels[english_text] = label
+        
+        return label if label.strip() else english_text
     
     # ============================================================
     # MANUAL LANGUAGE SELECTOR
     # ============================================================
     with st.expander("🌐 Change Language Manually"):
         try:
-            resp = requests.get(f"{API_BASE_URL}/api/language/supported", timeout=5)
-            resp.raise_for_status()
-
-            langs = resp.json().get("languages", [])
-            lang_dict = {l["name"]: l["code"] for l in langs}
-
-            current_name = next(
-                (n for n, c in lang_dict.items() if c == st.session_state.current_language),
-                "English"
-            )
+            lang_dict, code_to_name, names, name_to_idx = language_tables()
+            current_name = code_to_name.get(st.session_state.current_language, "English")
 
             selected = st.selectbox(
                 "Select Language:",
-                options=list(lang_dict.keys()),
-                index=list(lang_dict.keys()).index(current_name),
+                options=names,
+                index=name_to_idx.get(current_name, 0),
                 key="manual_lang_select"
             )
 
             if lang_dict[selected] != st.session_state.current_language:
-                if st.button("Apply Language Change", key="apply_manual_lang"):
-                    new_lang = lang_dict[selected]
-                    st.session_state.current_language = new_lang
-
-                    # Re-translate analysis if exists
-                    if st.session_state.get("analysis_result"):
-                        analysis = st.session_state.analysis_result
-
-                        if analysis.get("symptoms"):
-                            if new_lang != "en":
-                                try:
-                                    translated_symptoms = [
-                                        translate_text(sym, target_lang=new_lang, source_lang="en")
-                                        for sym in analysis["symptoms"]
-                                    ]
-                                    analysis["symptoms_translated"] = translated_symptoms
-                                except Exception:
-                                    analysis["symptoms_translated"] = analysis.get("symptoms", [])
-                            else:
-                                analysis["symptoms_translated"] = analysis.get("symptoms", [])
-
-                        if analysis.get("questions"):
-                            if new_lang != "en":
-                                try:
-                                    translated_questions = [
-                                        translate_text(q, target_lang=new_lang, source_lang="en")
-                                        for q in analysis["questions"]
-                                    ]
-                                    analysis["questions_translated"] = translated_questions
-                                except Exception:
-                                    analysis["questions_translated"] = analysis.get("questions", [])
-                            else:
-                                analysis["questions_translated"] = analysis.get("questions", [])
-
-                        st.session_state.analysis_result = analysis
-
-                    st.success(f"✅ Language changed to {selected}")
-                    time.sleep(1)
-                    st.rerun()
+                st.button(
+                    "Apply Language Change",
+                    key="apply_manual_lang",
+                    on_click=switch_language,
+                    args=(lang_dict[selected], f"✅ Language changed to {selected}")
+                )
 
         except RequestException:
             st.error("Language service unavailable")
@@ -780,7 +1223,10 @@ def show_patient_registration():
             })
 
         # === ANALYSIS LOGIC ===
-        if analyze and symptoms_desc:
+        # ⏱️ Re-submitting the same description reuses the stored analysis instead of another LLM call
+        if analyze and symptoms_desc and st.session_state.analysis_result and symptoms_desc == st.session_state.get('last_analyzed_desc'):
+            st.info(get_label("ℹ️ This description has already been analyzed - see the results below."))
+        elif analyze and symptoms_desc:
             with st.spinner(get_label("🤖 Analyzing your description...")):
                 try:
                     # Detect language first
@@ -788,23 +1234,16 @@ def show_patient_registration():
                     
                     if detected_language == "en":
                         try:
-                            detect_resp = requests.post(
-                                f"{API_BASE_URL}/api/language/detect",
-                                json={"text": symptoms_desc},
-                                timeout=10
-                            )
+                            detect_data = detect_language(symptoms_desc)
+                            confidence = detect_data.get("confidence", "low")
                             
-                            if detect_resp.status_code == 200:
-                                detect_data = detect_resp.json()
-                                confidence = detect_data.get("confidence", "low")
-                                
-                                if confidence in ["high", "medium"]:
-                                    detected_language = detect_data.get("detected", "en")
+                            if confidence in ["high", "medium"]:
+                                detected_language = detect_data.get("detected", "en")
                         except Exception as e:
                             print(f"Detection error: {e}")
                     
                     # Send analysis request
-                    resp = requests.post(
+                    resp = get_session().post(
                         f"{API_BASE_URL}/api/patients/analyze-symptoms",
                         json={
                             "description": symptoms_desc,
@@ -812,16 +1251,12 @@ def show_patient_registration():
                         },
                         timeout=None  # Allow longer processing time
                     )
-                    
+                
                     if resp.status_code == 200:
-                        analysis = resp.json()
+                        analysis = parse_json(resp)
                         
                         # Check LLM availability
-                        try:
-                            api_info = requests.get(f"{API_BASE_URL}/", timeout=5)
-                            llm_available = api_info.json().get("llm_available", False) if api_info.status_code == 200 else False
-                        except:
-                            llm_available = False
+                        llm_available = llm_enabled()
                         
                         if not llm_available:
                             analysis['questions'] = []
@@ -829,22 +1264,17 @@ def show_patient_registration():
                         
                         # ✅ FIX: Safe translation with fallback
                         if st.session_state.current_language != 'en':
-                            # Translate symptoms (with fallback)
-                            analysis['symptoms_translated'] = []
-                            for sym in analysis['symptoms']:
-                                translated = translate_text(sym, target_lang=st.session_state.current_language, source_lang='en')
-                                # Fallback to original if translation failed
-                                analysis['symptoms_translated'].append(translated if translated and translated != sym else sym)
-                            
-                            # Translate questions ONLY if LLM mode (with fallback)
-                            if llm_available and analysis.get('questions'):
-                                analysis['questions_translated'] = []
-                                for q in analysis['questions']:
-                                    translated = translate_text(q, target_lang=st.session_state.current_language, source_lang='en')
-                                    # Fallback to English if translation failed
-                                    analysis['questions_translated'].append(translated if translated else q)
-                            else:
-                                analysis['questions_translated'] = []
+                            # Symptoms, plus questions ONLY in LLM mode, in one request
+                            # (untranslated items fall back to the English original)
+                            symptoms = analysis['symptoms']
+                            questions = (analysis.get('questions') or []) if llm_available else []
+                            translated = translate_batch(
+                                symptoms + questions,
+                                target_lang=st.session_state.current_language,
+                                source_lang='en'
+                            )
+                            analysis['symptoms_translated'] = translated[:len(symptoms)]
+                            analysis['questions_translated'] = translated[len(symptoms):]
                         else:
                             # English mode - no translation needed
                             analysis['symptoms_translated'] = analysis.get('symptoms', [])
@@ -854,6 +1284,8 @@ def show_patient_registration():
                                 analysis['questions_translated'] = []
                         
                         st.session_state.analysis_result = analysis
+                        st.session_state.last_analyzed_desc = symptoms_desc
+                        st.session_state.reg_llm_available = llm_available
                         
                         # Initialize symptom details
                         extracted_info = analysis.get('extracted_info', {})
@@ -878,11 +1310,11 @@ def show_patient_registration():
         if st.session_state.analysis_result:
             analysis = st.session_state.analysis_result
             
-            try:
-                api_info = requests.get(f"{API_BASE_URL}/", timeout=5)
-                llm_available = api_info.json().get("llm_available", False) if api_info.status_code == 200 else False
-            except:
-                llm_available = False
+            # LLM availability was checked alongside the analysis - no need to ask again each rerun
+            llm_available = st.session_state.get('reg_llm_available')
+            if llm_available is None:
+                llm_available = llm_enabled()
+                st.session_state.reg_llm_available = llm_available
             
             st.markdown("---")
             st.markdown(f"### {get_label('🎯 Analysis Results')}")
@@ -1073,9 +1505,12 @@ def show_patient_registration():
                 st.error(get_label("❌ Password must be 6+ characters"))
                 return
             
-            # Build per_symptom data
+            # Build per_symptom data from the reviewed analysis; when the user skipped
+            # "Analyze" or changed the description since, leave it empty and the
+            # backend analyzes the current text during registration
             per_symptom = {}
-            if st.session_state.analysis_result and st.session_state.symptom_details:
+            analysis_current = symptoms_desc == st.session_state.get('last_analyzed_desc')
+            if analysis_current and st.session_state.analysis_result and st.session_state.symptom_details:
                 for symptom_en in st.session_state.analysis_result['symptoms']:
                     per_symptom[symptom_en] = st.session_state.symptom_details.get(symptom_en, {
                         "Duration": "",
@@ -1084,16 +1519,17 @@ def show_patient_registration():
                         "Factors": "",
                         "Additional Notes": symptoms_desc
                     })
-            else:
-                per_symptom = {
-                    "General": {
-                        "Duration": "",
-                        "Severity": "",
-                        "Frequency": "",
-                        "Factors": "",
-                        "Additional Notes": symptoms_desc
-                    }
-                }
+            
+            # The backend analyzes unreviewed text, so tag it with its detected
+            # language the same way the Analyze button does
+            source_language = st.session_state.current_language
+            if not per_symptom and source_language == "en":
+                try:
+                    detect_data = detect_language(symptoms_desc)
+                    if detect_data.get("confidence", "low") in ["high", "medium"]:
+                        source_language = detect_data.get("detected", "en")
+                except (requests.exceptions.RequestException, ValueError) as e:
+                    print(f"Detection error: {e}")
             
             # Registration payload
             patient_data = {
@@ -1111,19 +1547,21 @@ def show_patient_registration():
                     "Have you had any surgeries in the past?": q3 or "None",
                     "Do you have any allergies?": q4 or "None"
                 },
-                "password": password
+                "password": password,
+                "description": symptoms_desc,
+                "source_language": source_language
             }
             
             try:
                 with st.spinner(get_label("Creating your account...")):
-                    resp = requests.post(
-                        f"{API_BASE_URL}/api/auth/patient/register",
+                    resp = get_session().post(
+                        f"{API_BASE_URL}/api/auth/patient/register-with-analysis",
                         json=patient_data,
-                        timeout=15
+                        timeout=15 if per_symptom else 120  # Server-side analysis can take a while
                     )
                     
                     if resp.status_code == 200:
-                        data = resp.json()
+                        data = parse_json(resp)
                         st.session_state.logged_in = True
                         st.session_state.user_type = "patient"
                         st.session_state.access_token = data["access_token"]
@@ -1137,6 +1575,8 @@ def show_patient_registration():
                         }
                         st.session_state.symptom_details = {}
                         st.session_state.analysis_result = None
+                        st.session_state.last_analyzed_desc = ""
+                        st.session_state.reg_llm_available = None
                         st.session_state.question_answers = {}
                         st.session_state.last_language_check = ""
                         
@@ -1171,29 +1611,22 @@ def show_patient_registration():
         st.session_state.last_language_check = current_symptoms
         
         try:
-            detect_resp = requests.post(
-                f"{API_BASE_URL}/api/language/detect",
-                json={"text": current_symptoms},
-                timeout=5
-            )
+            detect_data = detect_language(current_symptoms)
+            detected_lang = detect_data.get("detected", "en")
+            lang_name = detect_data.get("language_name", "Unknown")
+            confidence = detect_data.get("confidence", "low")
             
-            if detect_resp.status_code == 200:
-                detect_data = detect_resp.json()
-                detected_lang = detect_data.get("detected", "en")
-                lang_name = detect_data.get("language_name", "Unknown")
-                confidence = detect_data.get("confidence", "low")
-                
-                print(f"🔍 Detected: {detected_lang} ({confidence})")
-                
-                # Show dialog if high confidence and NOT English
-                if confidence == "high" and detected_lang != "en":
-                    st.session_state.pending_language_change = {
-                        "code": detected_lang,
-                        "name": lang_name,
-                        "triggered_by": "symptom description"
-                    }
-                    print(f"✅ Pending language change: {lang_name}")
-                    st.rerun()
+            print(f"🔍 Detected: {detected_lang} ({confidence})")
+            
+            # Show dialog if high confidence and NOT English
+            if confidence == "high" and detected_lang != "en":
+                st.session_state.pending_language_change = {
+                    "code": detected_lang,
+                    "name": lang_name,
+                    "triggered_by": "symptom description"
+                }
+                print(f"✅ Pending language change: {lang_name}")
+                st.rerun()
         
         except Exception as e:
             print(f"⚠️ Detection error: {e}")
@@ -1233,7 +1666,7 @@ def show_staff_registration():
                 # API call
                 with st.spinner("Submitting registration..."):
                     try:
-                        response = requests.post(
+                        response = get_session().post(
                             f"{API_BASE_URL}/api/doctors/register",
                             json={
                                 "name": name,
@@ -1288,7 +1721,7 @@ def show_staff_registration():
                 
                 with st.spinner("Creating admin account..."):
                     try:
-                        response = requests.post(
+                        response = get_session().post(
                             f"{API_BASE_URL}/api/admin/create-first",
                             json={
                                 "name": name,
@@ -1321,18 +1754,158 @@ def show_dashboard():
     elif st.session_state.user_type == "admin":
         show_admin_dashboard()
 
+def write_fields(details, fields):
+    """Render the present fields as one markdown block instead of one st.write per line"""
+    lines = [f"{label} {details[key]}" for key, label in fields if details.get(key)]
+    if lines:
+        st.markdown("  \n".join(lines))
+
+@st.cache_resource
+def get_write_pool():
+    """
+    Worker threads for background profile saves (shared by all sessions)
+    Kept apart from the prefetch pool so slow summary-regenerating PUTs never starve prefetches
+    """
+    return ThreadPoolExecutor(max_workers=4)
+
+def put_profile(payload, success_msg):
+    """
+    Form callback helper: start PUT /api/patients/me in the background
+    The dashboard shows the change right away and reports the outcome on a later run
+    Only one save runs at a time, so no outcome is overwritten before it is reported
+    Returns True when the save was started
+    """
+    if resolve_pending_update():
+        st.session_state.update_notice = ("error", "⏳ Your previous changes are still saving - try again in a moment.")
+        return False
+    
+    future = get_write_pool().submit(
+        get_session(st.session_state.access_token).put,
+        f"{API_BASE_URL}/api/patients/me",
+        json=payload,
+        timeout=120  # Symptom/health updates regenerate the summary server-side
+    )
+    st.session_state.pending_update = {"future": future, "payload": payload, "message": success_msg}
+    return True
+
+def resolve_pending_update():
+    """
+    Check the background profile PUT: returns it while still running,
+    otherwise records its outcome as the update notice and returns None
+    """
+    pending = st.session_state.get("pending_update")
+    if not pending or not pending["future"].done():
+        return pending
+    
+    st.session_state.pending_update = None
+    try:
+        upd_resp = pending["future"].result()
+        
+        if upd_resp.status_code == 200:
+            invalidate_profile()
+            st.session_state.update_notice = ("success", pending["message"])
+        else:
+            st.session_state.update_notice = ("error", parse_api_error(upd_resp))
+    
+    except requests.exceptions.Timeout:
+        st.session_state.update_notice = ("error", "⏱️ Request timed out.")
+    except BackendDown as e:
+        st.session_state.update_notice = ("error", f"🔌 {e}")
+    except requests.exceptions.ConnectionError:
+        st.session_state.update_notice = ("error", "🔌 Cannot connect to server.")
+    except Exception as e:
+        st.session_state.update_notice = ("error", f"❌ Update failed: {e}")
+    return None
+
+def apply_pending_update(patient_data, payload):
+    """Copy of patient_data with an in-flight update applied (optimistic display)"""
+    data = dict(patient_data)
+    if "demographic" in payload:
+        data["demographic"] = {**data["demographic"], **payload["demographic"]}
+    if "per_symptom_patch" in payload:
+        data["per_symptom"] = {**data.get("per_symptom", {}), **payload["per_symptom_patch"]}
+    if "gen_questions_patch" in payload:
+        data["gen_questions"] = {**data.get("gen_questions", {}), **payload["gen_questions_patch"]}
+    return data
+
+def save_demographics():
+    """Form callback: validate and save the demographics form"""
+    state = st.session_state
+    if not validate_email(state.upd_email):
+        state.update_notice = ("error", "❌ Invalid email format")
+    elif not validate_phone(state.upd_phone):
+        state.update_notice = ("error", "❌ Invalid phone (need 10+ digits)")
+    else:
+        put_profile({
+            "demographic": {
+                "name": state.upd_name,
+                "age": state.upd_age,
+                "gender": state.upd_gender,
+                "email": state.upd_email,
+                "phone": state.upd_phone
+            }
+        }, "✅ Demographics updated!")
+
+def save_symptom(symptom):
+    """Form callback: send only the edited symptom - the backend merges it in"""
+    state = st.session_state
+    put_profile({
+        "per_symptom_patch": {
+            symptom: {
+                "Duration": state[f"upd_{symptom}_duration"],
+                "Severity": state[f"upd_{symptom}_severity"],
+                "Frequency": state[f"upd_{symptom}_frequency"],
+                "Factors": state[f"upd_{symptom}_factors"],
+                "Additional Notes": state[f"upd_{symptom}_notes"]
+            }
+        }
+    }, f"✅ {symptom} updated!")
+
+def add_new_symptoms(symptoms):
+    """Form callback: add the analyzed symptom(s) with the reviewed details - existing ones are kept server-side"""
+    state = st.session_state
+    details = {
+        "Duration": state.new_sym_duration,
+        "Severity": state.new_sym_severity,
+        "Frequency": state.new_sym_frequency,
+        "Factors": state.new_sym_factors,
+        "Additional Notes": state.new_symptom_desc
+    }
+    started = put_profile(
+        {"per_symptom_patch": {symptom: dict(details) for symptom in symptoms}},
+        "✅ New symptom added! PDF will be regenerated."
+    )
+    if started:
+        del state.new_symptom_analysis
+        del state.new_symptom_desc
+
+def save_general_health(current_questions):
+    """Form callback: send only the answers that changed - the backend merges them in"""
+    answers = {q: st.session_state[f"upd_q{i}"] for i, q in enumerate(GENERAL_QUESTIONS)}
+    changed = {q: a for q, a in answers.items() if a != current_questions.get(q, "")}
+    
+    if not changed:
+        st.session_state.update_notice = ("info", "No changes to save")
+    else:
+        put_profile({"gen_questions_patch": changed}, "✅ Health information updated!")
+
 def show_patient_dashboard():
     """FIXED PATIENT DASHBOARD - Auto-refresh for summary generation"""
     st.title("👤 Patient Dashboard")
-    headers = {"Authorization": f"Bearer {st.session_state.access_token}"}
+    session = get_session(st.session_state.access_token)
     
     try:
-        resp = requests.get(f"{API_BASE_URL}/api/patients/me", headers=headers)
-        if resp.status_code != 200:
+        pending = resolve_pending_update()
+        try:
+            patient_data = fetch_profile(st.session_state.access_token, st.session_state.profile_version)
+        except requests.exceptions.HTTPError:
             st.error("Failed to load data")
             return
         
-        patient_data = resp.json()
+        # Show a save that is still in flight as if it had already landed
+        if pending:
+            patient_data = apply_pending_update(patient_data, pending["payload"])
+        
         tab1, tab2, tab3, tab4 = st.tabs(["📋 Profile", "🩺 Records", "✏️ Update", "💬 Change Password"])
         
         # TAB 1: Profile (keep existing code)
@@ -1366,31 +1939,17 @@ def show_patient_dashboard():
             # ============================================================
             
             # Check if LLM is enabled
-            try:
-                api_info = requests.get(f"{API_BASE_URL}/", timeout=5)
-                llm_available = api_info.json().get("llm_available", False) if api_info.status_code == 200 else False
-            except:
-                llm_available = False
+            llm_available = llm_enabled()
             
             # CASE 1: Summary is being generated (LLM MODE ONLY)
             if summary_status == "generating" and llm_available:
                 st.warning("🤖 **AI Clinical Summary is being generated...**")
                 
                 # Pulsing animation
-                st.markdown("""
-                <style>
-                @keyframes pulse {
-                    0%, 100% { opacity: 1; }
-                    50% { opacity: 0.5; }
-                }
-                .generating-text {
-                    animation: pulse 2s ease-in-out infinite;
-                    font-size: 1.2rem;
-                    color: #ff9800;
-                }
-                </style>
-                <div class="generating-text">⏳ AI is analyzing your health data...</div>
-                """, unsafe_allow_html=True)
+                st.markdown(
+                    '<div class="generating-text" style="font-size: 1.2rem;">⏳ AI is analyzing your health data...</div>',
+                    unsafe_allow_html=True
+                )
                 
                 st.info("📊 **What's happening:**")
                 st.markdown("""
@@ -1418,6 +1977,7 @@ def show_patient_dashboard():
                 
                 with col1:
                     if st.button("🔄 Check Status Now", use_container_width=True, key="check_summary_btn"):
+                        invalidate_profile()
                         st.rerun()
                 
                 with col2:
@@ -1427,6 +1987,7 @@ def show_patient_dashboard():
                 
                 # ⚡ Auto-refresh every 15 seconds
                 time.sleep(15)
+                invalidate_profile()
                 st.rerun()
             
             # CASE 2: Summary generation completed
@@ -1470,14 +2031,14 @@ def show_patient_dashboard():
                 if st.button("🔄 Retry Summary Generation", use_container_width=True, key="retry_summary_btn"):
                     with st.spinner("Retrying..."):
                         try:
-                            retry_resp = requests.post(
+                            retry_resp = session.post(
                                 f"{API_BASE_URL}/api/patients/me/regenerate-summary",
-                                headers=headers,
                                 timeout=10
                             )
                             
                             if retry_resp.status_code == 200:
                                 st.success("✅ Summary generation restarted!")
+                                invalidate_profile()
                                 time.sleep(2)
                                 st.rerun()
                             else:
@@ -1508,21 +2069,10 @@ def show_patient_dashboard():
             
             symptoms = patient_data.get("per_symptom", {})
             if symptoms:
+                # Collapsed expanders still ship their contents - keep each one to a single element
                 for sym, det in symptoms.items():
                     with st.expander(f"📍 {sym.upper()}", expanded=False):
-                        col1, col2 = st.columns(2)
-                        with col1:
-                            if det.get("Duration"):
-                                st.write(f"**Duration:** {det['Duration']}")
-                            if det.get("Severity"):
-                                st.write(f"**Severity:** {det['Severity']}")
-                        with col2:
-                            if det.get("Frequency"):
-                                st.write(f"**Frequency:** {det['Frequency']}")
-                            if det.get("Factors"):
-                                st.write(f"**Factors:** {det['Factors']}")
-                        if det.get("Additional Notes"):
-                            st.write(f"**Notes:** {det['Additional Notes']}")
+                        write_fields(det, SYMPTOM_FIELDS)
             else:
                 st.info("No symptoms recorded")
             
@@ -1534,10 +2084,11 @@ def show_patient_dashboard():
             
             gen_questions = patient_data.get("gen_questions", {})
             if gen_questions:
-                for question, answer in gen_questions.items():
-                    if answer and answer.strip() and answer.lower() != "none":
-                        st.write(f"**{question}**")
-                        st.write(f"↳ {answer}")
+                st.markdown("\n\n".join(
+                    f"**{question}**  \n↳ {answer}"
+                    for question, answer in gen_questions.items()
+                    if answer and answer.strip() and answer.lower() != "none"
+                ))
             else:
                 st.info("No general health information recorded")    
         
@@ -1545,6 +2096,15 @@ def show_patient_dashboard():
         with tab3:
             st.subheader("✏️ Update Your Information")
             
+            # Outcome of the last save (set by the form callbacks before this run)
+            notice = st.session_state.pop("update_notice", None)
+            if notice:
+                getattr(st, notice[0])(notice[1])
+            elif pending:
+                # Picked up on the next run - no sleep-and-rerun loop in the render path
+                st.info("⏳ Saving your changes...")
+                st.button("🔄 Check save status", key="check_save_btn")
+            
             # Use st.radio for section selection instead of expanders
             update_section = st.radio(
                 "Choose what to update:",
@@ -1560,57 +2120,27 @@ def show_patient_dashboard():
                 st.info("💡 Update any demographic field below")
                 demo = patient_data["demographic"]
                 
+                # Saved in an on_click callback, so the single rerun already shows the new data
                 with st.form("update_demographics"):
                     col1, col2 = st.columns(2)
                     with col1:
-                        new_name = st.text_input("Name", value=demo['name'])
-                        new_age = st.number_input("Age", 0, 150, value=int(demo['age']))
-                        new_email = st.text_input("Email", value=demo['email'])
+                        st.text_input("Name", value=demo['name'], key="upd_name")
+                        st.number_input("Age", 0, 150, value=int(demo['age']), key="upd_age")
+                        st.text_input("Email", value=demo['email'], key="upd_email")
                     with col2:
-                        new_gender = st.selectbox(
+                        st.selectbox(
                             "Gender",
                             ["Male", "Female", "Other"],
-                            index=["Male", "Female", "Other"].index(demo['gender'])
+                            index=["Male", "Female", "Other"].index(demo['gender']),
+                            key="upd_gender"
                         )
-                        new_phone = st.text_input("Phone", value=demo['phone'])
+                        st.text_input("Phone", value=demo['phone'], key="upd_phone")
                     
-                    if st.form_submit_button("💾 Update Demographics", use_container_width=True):
-                        if not validate_email(new_email):
-                            st.error("❌ Invalid email format")
-                        elif not validate_phone(new_phone):
-                            st.error("❌ Invalid phone (need 10+ digits)")
-                        else:
-                            with st.spinner("Updating..."):
-                                try:
-                                    update_payload = {
-                                        "demographic": {
-                                            "name": new_name,
-                                            "age": new_age,
-                                            "gender": new_gender,
-                                            "email": new_email,
-                                            "phone": new_phone
-                                        }
-                                    }
-                                    upd_resp = requests.put(
-                                        f"{API_BASE_URL}/api/patients/me",
-                                        headers=headers,
-                                        json=update_payload,
-                                        timeout=10
-                                    )
-                                    
-                                    if upd_resp.status_code == 200:
-                                        st.success("✅ Demographics updated!")
-                                        time.sleep(1)
-                                        st.rerun()
-                                    else:
-                                        st.error(parse_api_error(upd_resp))
-                                
-                                except requests.exceptions.Timeout:
-                                    st.error("⏱️ Request timed out.")
-                                except requests.exceptions.ConnectionError:
-                                    st.error("🔌 Cannot connect to server.")
-                                except Exception as e:
-                                    st.error("❌ Update failed.")
+                    st.form_submit_button(
+                        "💾 Update Demographics",
+                        use_container_width=True,
+                        on_click=save_demographics
+                    )
             
             # Section 2: Update Existing Symptoms
             elif update_section == "🩺 Existing Symptoms":
@@ -1633,44 +2163,25 @@ def show_patient_dashboard():
                         st.markdown(f"#### Editing: **{symptom_to_edit.upper()}**")
                         
                         with st.form(f"update_symptom_{symptom_to_edit}"):
+                            key = f"upd_{symptom_to_edit}"
                             col1, col2 = st.columns(2)
                             with col1:
-                                duration = st.text_input("Duration", value=symptom_details.get("Duration", ""))
-                                severity = st.text_input("Severity (1-10)", value=symptom_details.get("Severity", ""))
+                                st.text_input("Duration", value=symptom_details.get("Duration", ""), key=f"{key}_duration")
+                                st.text_input("Severity (1-10)", value=symptom_details.get("Severity", ""), key=f"{key}_severity")
                             with col2:
-                                frequency = st.text_input("Frequency", value=symptom_details.get("Frequency", ""))
-                                factors = st.text_input("Triggers/Factors", value=symptom_details.get("Factors", ""))
+                                st.text_input("Frequency", value=symptom_details.get("Frequency", ""), key=f"{key}_frequency")
+                                st.text_input("Triggers/Factors", value=symptom_details.get("Factors", ""), key=f"{key}_factors")
                             
-                            additional_notes = st.text_area("Additional Notes", 
-                                                        value=symptom_details.get("Additional Notes", ""),
-                                                        height=100)
+                            st.text_area("Additional Notes", 
+                                         value=symptom_details.get("Additional Notes", ""),
+                                         height=100,
+                                         key=f"{key}_notes")
                             
-                            if st.form_submit_button(f"💾 Update {symptom_to_edit}"):
-                                with st.spinner(f"Updating {symptom_to_edit}..."):
-                                    try:
-                                        updated_symptoms = {}
-                                        for sym_name, sym_det in current_symptoms.items():
-                                            if sym_name == symptom_to_edit:
-                                                updated_symptoms[sym_name] = {
-                                                    "Duration": duration,
-                                                    "Severity": severity,
-                                                    "Frequency": frequency,
-                                                    "Factors": factors,
-                                                    "Additional Notes": additional_notes
-                                                }
-                                            else:
-                                                updated_symptoms[sym_name] = sym_det
-                                        
-                                        update_payload = {"per_symptom": updated_symptoms}
-                                        upd_resp = requests.put(f"{API_BASE_URL}/api/patients/me", headers=headers, json=update_payload)
-                                        
-                                        if upd_resp.status_code == 200:
-                                            st.success(f"✅ {symptom_to_edit} updated!")
-                                            st.rerun()
-                                        else:
-                                            st.error(parse_api_error(upd_resp))
-                                    except Exception as e:
-                                        st.error(f"Error: {str(e)}")
+                            st.form_submit_button(
+                                f"💾 Update {symptom_to_edit}",
+                                on_click=save_symptom,
+                                args=(symptom_to_edit,)
+                            )
             
             # Section 3: Add New Symptom
             elif update_section == "➕ Add New Symptom":
@@ -1699,89 +2210,66 @@ def show_patient_dashboard():
                 st.markdown("---")
                 st.markdown("💡 **Have feedback?** Let us know what features you'd like to see!")
                 
-                feedback = st.text_area(
-                    "Share your suggestions (optional):",
-                    placeholder="What would make this feature more useful for you?",
-                    height=100,
-                    key="add_symptom_feedback"
-                )
-                
-                if st.button("📧 Send Feedback", key="send_feedback_btn"):
-                    if feedback:
-                        # You can implement actual feedback storage later
-                        st.success("✅ Thank you for your feedback! We'll consider it in our next update.")
-                    else:
-                        st.warning("Please enter some feedback first")
+                # Form so typing feedback doesn't rerun the dashboard - only Send does
+                with st.form("add_symptom_feedback_form", clear_on_submit=True):
+                    feedback = st.text_area(
+                        "Share your suggestions (optional):",
+                        placeholder="What would make this feature more useful for you?",
+                        height=100,
+                        key="add_symptom_feedback"
+                    )
+                    
+                    if st.form_submit_button("📧 Send Feedback"):
+                        if feedback:
+                            # You can implement actual feedback storage later
+                            st.success("✅ Thank you for your feedback! We'll consider it in our next update.")
+                        else:
+                            st.warning("Please enter some feedback first")
                 
                 # Show analysis results
                 if 'new_symptom_analysis' in st.session_state:
                     analysis = st.session_state.new_symptom_analysis
                     
                     st.markdown("#### 🎯 Detected Symptoms")
-                    for sym in analysis['symptoms']:
-                        st.write(f"• **{sym}**")
+                    st.markdown("  \n".join(f"• **{sym}**" for sym in analysis['symptoms']))
                     
                     st.markdown("#### 📊 Extracted Information")
                     extracted = analysis.get('extracted_info', {})
                     if extracted:
-                        for k, v in extracted.items():
-                            st.write(f"• {k}: ✅ **{v}**")
+                        st.markdown("  \n".join(f"• {k}: ✅ **{v}**" for k, v in extracted.items()))
                     
                     st.markdown("#### ✍️ Complete Missing Details")
                     
                     with st.form("add_new_symptom_form"):
                         col1, col2 = st.columns(2)
                         with col1:
-                            final_duration = st.text_input(
+                            st.text_input(
                                 "Duration" + (" ✓" if "Duration" in extracted else " *"),
-                                value=extracted.get("Duration", "")
+                                value=extracted.get("Duration", ""),
+                                key="new_sym_duration"
                             )
-                            final_severity = st.text_input(
+                            st.text_input(
                                 "Severity (1-10)" + (" ✓" if "Severity" in extracted else " *"),
-                                value=extracted.get("Severity", "")
+                                value=extracted.get("Severity", ""),
+                                key="new_sym_severity"
                             )
                         with col2:
-                            final_frequency = st.text_input(
+                            st.text_input(
                                 "Frequency" + (" ✓" if "Frequency" in extracted else " *"),
-                                value=extracted.get("Frequency", "")
+                                value=extracted.get("Frequency", ""),
+                                key="new_sym_frequency"
                             )
-                            final_factors = st.text_input(
+                            st.text_input(
                                 "Triggers/Factors" + (" ✓" if "Factors" in extracted else ""),
-                                value=extracted.get("Factors", "")
+                                value=extracted.get("Factors", ""),
+                                key="new_sym_factors"
                             )
                         
-                        if st.form_submit_button("✅ Add This Symptom"):
-                            with st.spinner("Adding symptom..."):
-                                try:
-                                    new_symptoms = {}
-                                    
-                                    # Keep all existing symptoms
-                                    for sym_name, sym_det in patient_data["per_symptom"].items():
-                                        new_symptoms[sym_name] = sym_det
-                                    
-                                    # Add new symptom(s)
-                                    for detected_sym in analysis['symptoms']:
-                                        new_symptoms[detected_sym] = {
-                                            "Duration": final_duration,
-                                            "Severity": final_severity,
-                                            "Frequency": final_frequency,
-                                            "Factors": final_factors,
-                                            "Additional Notes": st.session_state.new_symptom_desc
-                                        }
-                                    
-                                    update_payload = {"per_symptom": new_symptoms}
-                                    upd_resp = requests.put(f"{API_BASE_URL}/api/patients/me", headers=headers, json=update_payload)
-                                    
-                                    if upd_resp.status_code == 200:
-                                        st.success("✅ New symptom added! PDF will be regenerated.")
-                                        del st.session_state.new_symptom_analysis
-                                        del st.session_state.new_symptom_desc
-                                        st.balloons()
-                                        st.rerun()
-                                    else:
-                                        st.error(parse_api_error(upd_resp))
-                                except Exception as e:
-                                    st.error(f"Error: {str(e)}")
+                        st.form_submit_button(
+                            "✅ Add This Symptom",
+                            on_click=add_new_symptoms,
+                            args=(tuple(analysis['symptoms']),)
+                        )
             
             # Section 4: Update General Health
             elif update_section == "🏥 General Health":
@@ -1791,66 +2279,33 @@ def show_patient_dashboard():
                 current_questions = patient_data.get("gen_questions", {})
                 
                 with st.form("update_general_health"):
-                    q1 = st.text_input(
-                        "Do you have any chronic health conditions?",
-                        value=current_questions.get("Do you have any chronic health conditions?", "")
-                    )
-                    q2 = st.text_input(
-                        "Are you currently taking any medications?",
-                        value=current_questions.get("Are you currently taking any medications?", "")
-                    )
-                    q3 = st.text_input(
-                        "Have you had any surgeries in the past?",
-                        value=current_questions.get("Have you had any surgeries in the past?", "")
-                    )
-                    q4 = st.text_input(
-                        "Do you have any allergies?",
-                        value=current_questions.get("Do you have any allergies?", "")
-                    )
+                    for i, question in enumerate(GENERAL_QUESTIONS):
+                        st.text_input(question, value=current_questions.get(question, ""), key=f"upd_q{i}")
                     
-                    if st.form_submit_button("💾 Update Health Info"):
-                        with st.spinner("Updating..."):
-                            try:
-                                update_payload = {
-                                    "gen_questions": {
-                                        "Do you have any chronic health conditions?": q1,
-                                        "Are you currently taking any medications?": q2,
-                                        "Have you had any surgeries in the past?": q3,
-                                        "Do you have any allergies?": q4
-                                    }
-                                }
-                                upd_resp = requests.put(f"{API_BASE_URL}/api/patients/me", headers=headers, json=update_payload)
-                                
-                                if upd_resp.status_code == 200:
-                                    st.success("✅ Health information updated!")
-                                    st.rerun()
-                                else:
-                                    st.error(parse_api_error(upd_resp))
-                            except Exception as e:
-                                st.error(f"Error: {str(e)}")
+                    st.form_submit_button(
+                        "💾 Update Health Info",
+                        on_click=save_general_health,
+                        args=(current_questions,)
+                    )
         
         # TAB 4: Change Password
         with tab4:
             st.subheader("🔐 Change Password")
             
-            with st.form("change_password_patient"):
+            with st.form("change_password_patient", clear_on_submit=True):
                 current_pwd = st.text_input("Current Password", type="password")
                 new_pwd = st.text_input("New Password (6+ chars)", type="password")
                 confirm_pwd = st.text_input("Confirm New Password", type="password")
                 
                 if st.form_submit_button("🔒 Change Password", use_container_width=True):
-                    if not all([current_pwd, new_pwd, confirm_pwd]):
-                        st.error("❌ Please fill all fields")
-                    elif len(new_pwd) < 6:
-                        st.error("❌ Password must be at least 6 characters")
-                    elif new_pwd != confirm_pwd:
-                        st.error("❌ Passwords don't match")
+                    pwd_error = validate_pwd(current_pwd, new_pwd, confirm_pwd)
+                    if pwd_error:
+                        st.error(pwd_error)
                     else:
                         with st.spinner("Changing password..."):
                             try:
-                                pwd_resp = requests.post(
+                                pwd_resp = session.post(
                                     f"{API_BASE_URL}/api/patients/me/change-password",
-                                    headers=headers,
                                     json={
                                         "current_password": current_pwd,
                                         "new_password": new_pwd
@@ -1876,13 +2331,33 @@ def show_patient_dashboard():
         import traceback
         st.code(traceback.format_exc())
 
+def select_patient(patient_id):
+    """Button callback: open (or with None, close) a patient's full record"""
+    st.session_state.selected_patient_id = patient_id
+
+def refresh_lists():
+    """Button callback: bump this session's list version so the next run refetches"""
+    st.session_state.list_version += 1
+    st.session_state.prefetched = {}
+
+def reset_insights(insights_key, patient_id):
+    """Button callback: bump this patient's insights generation so the request button shows again"""
+    generations = st.session_state.setdefault("insights_gen", {})
+    generations[patient_id] = generations.get(patient_id, 0) + 1
+    st.session_state[insights_key] = {
+        "status": "not_requested",
+        "start_time": None
+    }
+
 def show_doctor_dashboard():
     """
     COMPLETE DOCTOR DASHBOARD - FIXED VERSION
     Removed non-functional Copy & Print buttons from Clinical Insights
     """
+    import pandas as pd  # Only staff dashboards build tables - keep it off the patient/login cold start
     st.title("👨‍⚕️ Doctor Dashboard")
-    headers = {"Authorization": f"Bearer {st.session_state.access_token}"}
+    token = st.session_state.access_token
+    session = get_session(token)
     
     # Initialize session state for selected patient
     if 'selected_patient_id' not in st.session_state:
@@ -1899,49 +2374,57 @@ def show_doctor_dashboard():
     with tab1:
         st.subheader("All Registered Patients")
         st.info("💡 Basic patient information - Click 'Patient Details' tab to view full records")
+        st.button("🔄 Refresh", key="refresh_patients", on_click=refresh_lists)
         
         try:
-            resp = requests.get(
-                f"{API_BASE_URL}/api/patients/",
-                headers=headers,
-                timeout=10
-            )
+            patients = fetch_json(f"{API_BASE_URL}/api/patients/", token, version=st.session_state.list_version)
+            st.success(f"📊 Total Patients: {len(patients)}")
             
-            if resp.status_code == 200:
-                patients = resp.json()
-                st.success(f"📊 Total Patients: {len(patients)}")
+            if patients:
+                # One compact table instead of a row of widgets per patient
+                df = pd.DataFrame(patients)
+                df["created_at"] = pd.to_datetime(df["created_at"], unit="s", errors="coerce").dt.strftime("%Y-%m-%d")
+                df.index = range(1, len(df) + 1)
+                st.dataframe(
+                    df[["name", "age", "gender", "email", "phone", "created_at"]],
+                    column_config={
+                        "name": "Name",
+                        "age": "Age",
+                        "gender": "Gender",
+                        "email": "📧 Email",
+                        "phone": "📱 Phone",
+                        "created_at": "Registered"
+                    },
+                    use_container_width=True
+                )
                 
-                if patients:
-                    for idx, p in enumerate(patients, 1):
-                        with st.container():
-                            col1, col2, col3, col4 = st.columns([1, 3, 2, 2])
-                            
-                            with col1:
-                                st.markdown(f"**#{idx}**")
-                            
-                            with col2:
-                                st.markdown(f"**{p['name']}**")
-                                st.caption(f"Age: {p.get('age', 'N/A')} | Gender: {p.get('gender', 'N/A')}")
-                            
-                            with col3:
-                                st.markdown(f"📧 {p.get('email', 'N/A')}")
-                                st.caption(f"📱 {p.get('phone', 'N/A')}")
-                            
-                            with col4:
-                                if p.get('created_at'):
-                                    try:
-                                        from datetime import datetime
-                                        created = datetime.fromtimestamp(p['created_at'])
-                                        st.caption(f"Registered: {created.strftime('%Y-%m-%d')}")
-                                    except:
-                                        pass
-                            
-                            st.markdown("---")
-                else:
-                    st.warning("No patients registered yet")
+                # Details are only rendered for the one patient picked here
+                selected = st.selectbox(
+                    "👁️ Quick view",
+                    options=[None] + list(range(len(patients))),
+                    format_func=lambda i: "Select a patient..." if i is None else f"#{i + 1} {patients[i]['name']}",
+                    key="quick_view_patient"
+                )
+                
+                if selected is not None:
+                    p = patients[selected]
+                    # Load the full record while the doctor reads the quick view
+                    prefetch_json(f"{API_BASE_URL}/api/patients/{p['id']}", token)
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        st.markdown(f"**👤 {p['name']}**")
+                        st.caption(f"Age: {p.get('age', 'N/A')} | Gender: {p.get('gender', 'N/A')}")
+                    with col2:
+                        st.markdown(f"📧 {p.get('email', 'N/A')}")
+                        st.caption(f"📱 {p.get('phone', 'N/A')}")
+                    
+                    if st.button("🔍 Open Full Record", key="open_quick_view", on_click=select_patient, args=(p["id"],)):
+                        st.info("👉 Open the 'Patient Details' tab to view the full record")
             else:
-                st.error(parse_api_error(resp))
+                st.warning("No patients registered yet")
         
+        except requests.exceptions.HTTPError as e:
+            st.error(parse_api_error(e.response))
         except requests.exceptions.Timeout:
             st.error("⏱️ Request timed out. Please try again.")
         except requests.exceptions.ConnectionError:
@@ -1953,25 +2436,21 @@ def show_doctor_dashboard():
     with tab2:
         st.subheader("🔍 Search and View Patient Details")
 
-        # Search Section
-        col1, col2, col3 = st.columns([2, 2, 1])
-        with col1:
-            search_name = st.text_input("🔍 Search by Name", placeholder="Enter patient name...")
-        with col2:
-            search_email = st.text_input("📧 Search by Email", placeholder="Enter patient email...")
-        with col3:
-            st.markdown("<br>", unsafe_allow_html=True)
-            search_button = st.button("🔍 Search", use_container_width=True)
+        # Search and list only while no patient is open - the details view
+        # below replaces them, so skip the fetch and filter work entirely
+        if not st.session_state.get("selected_patient_id"):
+            # Search Section
+            col1, col2, col3 = st.columns([2, 2, 1])
+            with col1:
+                search_name = st.text_input("🔍 Search by Name", placeholder="Enter patient name...")
+            with col2:
+                search_email = st.text_input("📧 Search by Email", placeholder="Enter patient email...")
+            with col3:
+                st.markdown("<br>", unsafe_allow_html=True)
+                search_button = st.button("🔍 Search", use_container_width=True)
 
-        try:
-            resp = requests.get(
-                f"{API_BASE_URL}/api/patients/",
-                headers=headers,
-                timeout=10
-            )
-            
-            if resp.status_code == 200:
-                all_patients = resp.json()
+            try:
+                all_patients = fetch_json(f"{API_BASE_URL}/api/patients/", token, version=st.session_state.list_version)
 
                 # Filter patients
                 filtered_patients = all_patients
@@ -2005,392 +2484,357 @@ def show_doctor_dashboard():
                                     st.caption(f"📱 {p.get('phone')}")
 
                                 with c3:
-                                    if st.button(
+                                    # Callback sets the selection before the rerun - no second st.rerun()
+                                    st.button(
                                         "👁️ View Details",
                                         key=f"view_{p['id']}",
-                                        use_container_width=True
-                                    ):
-                                        st.session_state.selected_patient_id = p["id"]
-                                        st.rerun()
+                                        use_container_width=True,
+                                        on_click=select_patient,
+                                        args=(p["id"],)
+                                    )
                             st.markdown("---")
                     else:
                         st.warning("No patients found matching your search")
                 else:
                     st.info("👆 Use search fields above to find patients")
+        
+            except requests.exceptions.HTTPError as e:
+                st.error(parse_api_error(e.response))
+            except requests.exceptions.Timeout:
+                st.error("⏱️ Request timed out. Please try again.")
+            except requests.exceptions.ConnectionError:
+                st.error("🔌 Cannot connect to server.")
+            except Exception as e:
+                st.error("❌ Failed to load patients.")
 
-                # ==================== PATIENT DETAILS VIEW ====================
-                if st.session_state.get("selected_patient_id"):
-                    st.markdown("---")
-                    st.markdown("## 📄 Patient Details")
+        # ==================== PATIENT DETAILS VIEW ====================
+        if st.session_state.get("selected_patient_id"):
+            st.markdown("---")
+            st.markdown("## 📄 Patient Details")
+            patient_id = st.session_state.selected_patient_id
 
-                    try:
-                        detail_resp = requests.get(
-                            f"{API_BASE_URL}/api/patients/{st.session_state.selected_patient_id}",
-                            headers=headers,
-                            timeout=10
-                        )
+            try:
+                # Cached and revalidated with If-None-Match - repeat views of an
+                # unchanged record come back as an empty 304
+                patient_data = fetch_json_prefetched(
+                    f"{API_BASE_URL}/api/patients/{patient_id}",
+                    token
+                )
+                demo = patient_data["demographic"]
 
-                        if detail_resp.status_code == 200:
-                            patient_data = detail_resp.json()
-                            demo = patient_data["demographic"]
+                col1, col2 = st.columns([3, 1])
+                with col1:
+                    st.markdown(f"### 👤 {demo['name']}")
+                    st.caption(f"Patient ID: {patient_id[-8:].upper()}")
+                with col2:
+                    st.button("🔙 Back to Search", key="back_to_search", on_click=select_patient, args=(None,))
 
-                            col1, col2 = st.columns([3, 1])
-                            with col1:
-                                st.markdown(f"### 👤 {demo['name']}")
-                                st.caption(f"Patient ID: {st.session_state.selected_patient_id[-8:].upper()}")
-                            with col2:
-                                if st.button("🔙 Back to Search", key="back_to_search"):
-                                    st.session_state.selected_patient_id = None
-                                    st.rerun()
+                st.markdown("---")
 
+                # Demographics
+                with st.expander("👤 Demographics", expanded=True):
+                    c1, c2 = st.columns(2)
+                    with c1:
+                        st.info(f"**Name:** {demo['name']}")
+                        st.info(f"**Age:** {demo['age']}")
+                        st.info(f"**Gender:** {demo['gender']}")
+                    with c2:
+                        st.info(f"**Email:** {demo['email']}")
+                        st.info(f"**Phone:** {demo['phone']}")
+
+                # Clinical Summary
+                if patient_data.get("summary"):
+                    with st.expander("📋 Clinical Summary", expanded=True):
+                        st.success(patient_data["summary"])
+
+                # Symptoms
+                with st.expander("🩺 Reported Symptoms", expanded=True):
+                    symptoms = patient_data.get("per_symptom", {})
+                    if symptoms:
+                        for i, (name, d) in enumerate(symptoms.items(), 1):
+                            st.markdown(f"#### {i}. {name.upper()}")
+                            c1, c2 = st.columns(2)
+                            with c1:
+                                write_fields(d, (("Duration", "⏱️ Duration:"), ("Severity", "📊 Severity:")))
+                            with c2:
+                                write_fields(d, (("Frequency", "🔄 Frequency:"), ("Factors", "⚡ Factors:")))
+                            write_fields(d, (("Additional Notes", "📝 Notes:"),))
                             st.markdown("---")
+                    else:
+                        st.warning("No symptoms recorded")
 
-                            # Demographics
-                            with st.expander("👤 Demographics", expanded=True):
-                                c1, c2 = st.columns(2)
-                                with c1:
-                                    st.info(f"**Name:** {demo['name']}")
-                                    st.info(f"**Age:** {demo['age']}")
-                                    st.info(f"**Gender:** {demo['gender']}")
-                                with c2:
-                                    st.info(f"**Email:** {demo['email']}")
-                                    st.info(f"**Phone:** {demo['phone']}")
-
-                            # Clinical Summary
-                            if patient_data.get("summary"):
-                                with st.expander("📋 Clinical Summary", expanded=True):
-                                    st.success(patient_data["summary"])
-
-                            # Symptoms
-                            with st.expander("🩺 Reported Symptoms", expanded=True):
-                                symptoms = patient_data.get("per_symptom", {})
-                                if symptoms:
-                                    for i, (name, d) in enumerate(symptoms.items(), 1):
-                                        st.markdown(f"#### {i}. {name.upper()}")
-                                        c1, c2 = st.columns(2)
-                                        with c1:
-                                            if d.get("Duration"):
-                                                st.write(f"⏱️ Duration: {d['Duration']}")
-                                            if d.get("Severity"):
-                                                st.write(f"📊 Severity: {d['Severity']}")
-                                        with c2:
-                                            if d.get("Frequency"):
-                                                st.write(f"🔄 Frequency: {d['Frequency']}")
-                                            if d.get("Factors"):
-                                                st.write(f"⚡ Factors: {d['Factors']}")
-                                        if d.get("Additional Notes"):
-                                            st.write(f"📝 Notes: {d['Additional Notes']}")
-                                        st.markdown("---")
-                                else:
-                                    st.warning("No symptoms recorded")
+                # ==================== AI CLINICAL INSIGHTS ====================
+                st.markdown("---")
+                st.markdown("### 🧠 AI Clinical Insights")
 
-                            # ==================== AI CLINICAL INSIGHTS ====================
-                            st.markdown("---")
-                            st.markdown("### 🧠 AI Clinical Insights")
-                            
-                            # Check if LLM is available
-                            try:
-                                api_info = requests.get(f"{API_BASE_URL}/", timeout=5)
-                                llm_available = api_info.json().get("llm_available", False) if api_info.status_code == 200 else False
-                            except:
-                                llm_available = False
-                            
-                            if llm_available:
-                                st.info("💡 AI-powered differential diagnoses, investigations & red flags")
-                            else:
-                                st.info("💡 Clinical review notes and recommended actions")
+                # Check if LLM is available
+                llm_available = llm_enabled()
 
-                            # Initialize insights state
-                            insights_key = f"insights_{st.session_state.selected_patient_id}"
-                            if insights_key not in st.session_state:
-                                st.session_state[insights_key] = {
-                                    "status": "not_requested",
-                                    "insights": None,
-                                    "start_time": None
-                                }
+                if llm_available:
+                    st.info("💡 AI-powered differential diagnoses, investigations & red flags")
+                else:
+                    st.info("💡 Clinical review notes and recommended actions")
+
+                # Initialize insights state (the insights text itself lives in load_insights' cache)
+                insights_key = f"insights_{patient_id}"
+                if insights_key not in st.session_state:
+                    st.session_state[insights_key] = {
+                        "status": "not_requested",
+                        "start_time": None
+                    }
 
-                            current_state = st.session_state[insights_key]
+                current_state = st.session_state[insights_key]
 
-                            # ============================================================
-                            # REQUEST BUTTON
-                            # ============================================================
-                            if current_state["status"] == "not_requested":
-                                col1, col2, col3 = st.columns([1, 2, 1])
-                                with col2:
-                                    if llm_available:
-                                        button_text = "🤖 Generate AI Clinical Insights"
-                                        button_help = "AI-powered differential diagnoses and recommendations"
-                                    else:
-                                        button_text = "📋 Generate Clinical Review Notes"
-                                        button_help = "Template-based clinical review and recommendations"
-                                    
-                                    if st.button(
-                                        button_text,
-                                        use_container_width=True,
-                                        type="primary",
-                                        key="req_insights_btn",
-                                        help=button_help
-                                    ):
-                                        with st.spinner("🚀 Starting analysis..."):
-                                            try:
-                                                r = requests.post(
-                                                    f"{API_BASE_URL}/api/patients/{st.session_state.selected_patient_id}/clinical-insights",
-                                                    headers=headers,
-                                                    timeout=10
-                                                )
-                                                
-                                                if r.status_code == 200:
-                                                    data = r.json()
-                                                    
-                                                    if data["status"] == "completed":
-                                                        # Already completed (cached)
-                                                        st.session_state[insights_key] = {
-                                                            "status": "completed",
-                                                            "insights": data["insights"],
-                                                            "start_time": None
-                                                        }
-                                                        if llm_available:
-                                                            st.success("✅ AI insights ready (cached)!")
-                                                        else:
-                                                            st.success("✅ Clinical notes ready!")
-                                                    else:
-                                                        # Started generating
-                                                        st.session_state[insights_key]["status"] = "generating"
-                                                        st.session_state[insights_key]["start_time"] = time.time()
-                                                        
-                                                        if llm_available:
-                                                            st.success("✅ AI analysis started!")
-                                                        else:
-                                                            st.success("✅ Generating clinical notes...")
-                                                    
-                                                    st.rerun()
-                                                else:
-                                                    st.error(parse_api_error(r))
-                                            
-                                            except requests.exceptions.Timeout:
-                                                st.error("⏱️ Request timed out. Try again.")
-                                            except requests.exceptions.ConnectionError:
-                                                st.error("🔌 Cannot connect to server.")
-                                            except Exception as e:
-                                                st.error(f"❌ Error: {str(e)}")
-
-                            # ============================================================
-                            # GENERATING STATUS
-                            # ============================================================
-                            elif current_state["status"] == "generating":
-                                if llm_available:
-                                    st.warning("🤖 **AI is analyzing patient data...**")
-                                    
-                                    # Pulsing animation
-                                    st.markdown("""
-                                    <style>
-                                    @keyframes pulse {
-                                        0%, 100% { opacity: 1; }
-                                        50% { opacity: 0.5; }
-                                    }
-                                    .generating-text {
-                                        animation: pulse 2s ease-in-out infinite;
-                                        font-size: 1.1rem;
-                                        color: #ff9800;
-                                    }
-                                    </style>
-                                    <div class="generating-text">⏳ Generating comprehensive clinical analysis...</div>
-                                    """, unsafe_allow_html=True)
-                                    
-                                    st.info("📊 **AI Analysis includes:**")
-                                    st.markdown("""
-                                    - 🔍 Differential diagnoses
-                                    - 🧪 Recommended investigations
-                                    - ⚠️ Red flag symptoms
-                                    - 💊 Clinical considerations
-                                    """)
-                                    
-                                    # Show elapsed time
-                                    if current_state.get("start_time"):
-                                        elapsed = int(time.time() - current_state["start_time"])
-                                        mins = elapsed // 60
-                                        secs = elapsed % 60
-                                        st.metric("⏱️ Time Elapsed", f"{mins}m {secs}s")
-                                        
-                                        if elapsed < 300:
-                                            st.info("⏳ Usually takes 5-10 minutes")
-                                        else:
-                                            st.warning("⏳ Complex case - taking longer than usual...")
-                                else:
-                                    st.info("📝 **Generating clinical review notes...**")
-                                    st.caption("This should complete quickly")
-                                
-                                # Check status
+                # ============================================================
+                # REQUEST BUTTON
+                # ============================================================
+                if current_state["status"] == "not_requested":
+                    col1, col2, col3 = st.columns([1, 2, 1])
+                    with col2:
+                        if llm_available:
+                            button_text = "🤖 Generate AI Clinical Insights"
+                            button_help = "AI-powered differential diagnoses and recommendations"
+                        else:
+                            button_text = "📋 Generate Clinical Review Notes"
+                            button_help = "Template-based clinical review and recommendations"
+
+                        if st.button(
+                            button_text,
+                            use_container_width=True,
+                            type="primary",
+                            key="req_insights_btn",
+                            help=button_help
+                        ):
+                            with st.spinner("🚀 Starting analysis..."):
                                 try:
-                                    status_resp = requests.get(
-                                        f"{API_BASE_URL}/api/patients/{st.session_state.selected_patient_id}/clinical-insights",
-                                        headers=headers,
+                                    r = session.post(
+                                        f"{API_BASE_URL}/api/patients/{patient_id}/clinical-insights",
                                         timeout=10
                                     )
-                                    
-                                    if status_resp.status_code == 200:
-                                        status_data = status_resp.json()
-                                        
-                                        if status_data["status"] == "completed":
+
+                                    if r.status_code == 200:
+                                        data = parse_json(r)
+
+                                        if data["status"] == "completed":
+                                            # Already completed (cached)
                                             st.session_state[insights_key] = {
                                                 "status": "completed",
-                                                "insights": status_data["insights"],
                                                 "start_time": None
                                             }
-                                            st.success("✅ Insights generated!")
-                                            st.rerun()
-                                        
-                                        elif status_data["status"] == "generating":
-                                            st.markdown("---")
-                                            col1, col2 = st.columns(2)
-                                            
-                                            with col1:
-                                                if st.button("🔄 Check Now", use_container_width=True):
-                                                    st.rerun()
-                                            
-                                            with col2:
-                                                if llm_available:
-                                                    st.info("🔁 Auto-refresh: 15s")
-                                                else:
-                                                    st.info("🔁 Auto-refresh: 3s")
-                                            
                                             if llm_available:
-                                                st.success("💡 **Tip:** Close and come back - insights will be here!")
-                                                time.sleep(15)
+                                                st.success("✅ AI insights ready (cached)!")
+                                            else:
+                                                st.success("✅ Clinical notes ready!")
+                                        else:
+                                            # Started generating
+                                            st.session_state[insights_key]["status"] = "generating"
+                                            st.session_state[insights_key]["start_time"] = time.time()
+
+                                            if llm_available:
+                                                st.success("✅ AI analysis started!")
                                             else:
-                                                time.sleep(3)
-                                            
-                                            st.rerun()
-                                        
-                                        elif status_data["status"] == "failed":
-                                            st.error("❌ Generation failed")
-                                            st.session_state[insights_key]["status"] = "not_requested"
-                                            if st.button("🔄 Try Again"):
-                                                st.rerun()
+                                                st.success("✅ Generating clinical notes...")
+
+                                        st.rerun()
                                     else:
-                                        st.error(parse_api_error(status_resp))
-                                
+                                        st.error(parse_api_error(r))
+
                                 except requests.exceptions.Timeout:
-                                    st.error("⏱️ Status check timed out.")
-                                    if st.button("🔄 Retry"):
-                                        st.rerun()
+                                    st.error("⏱️ Request timed out. Try again.")
                                 except requests.exceptions.ConnectionError:
                                     st.error("🔌 Cannot connect to server.")
                                 except Exception as e:
-                                    st.error(f"⚠️ Error: {str(e)}")
-
-                            # ============================================================
-                            # DISPLAY RESULTS
-                            # ============================================================
-                            elif current_state["status"] == "completed":
-                                if llm_available:
-                                    st.success("✅ **AI Clinical Insights Generated!**")
-                                else:
-                                    st.success("✅ **Clinical Review Notes Generated**")
-                                
-                                st.markdown("""
-                                <style>
-                                .insights-box {
-                                    background: linear-gradient(135deg, #f4f8ff 0%, #e8f0ff 100%);
-                                    border-left: 6px solid #4c6ef5;
-                                    padding: 25px;
-                                    border-radius: 12px;
-                                    margin-top: 15px;
-                                    box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+                                    st.error(f"❌ Error: {str(e)}")
+
+                # ============================================================
+                # GENERATING STATUS
+                # ============================================================
+                elif current_state["status"] == "generating":
+                    if llm_available:
+                        st.warning("🤖 **AI is analyzing patient data...**")
+
+                        # Pulsing animation
+                        st.markdown(
+                            '<div class="generating-text">⏳ Generating comprehensive clinical analysis...</div>',
+                            unsafe_allow_html=True
+                        )
+
+                        st.info("📊 **AI Analysis includes:**")
+                        st.markdown("""
+                        - 🔍 Differential diagnoses
+                        - 🧪 Recommended investigations
+                        - ⚠️ Red flag symptoms
+                        - 💊 Clinical considerations
+                        """)
+
+                        # Show elapsed time
+                        if current_state.get("start_time"):
+                            elapsed = int(time.time() - current_state["start_time"])
+                            mins = elapsed // 60
+                            secs = elapsed % 60
+                            st.metric("⏱️ Time Elapsed", f"{mins}m {secs}s")
+
+                            if elapsed < 300:
+                                st.info("⏳ Usually takes 5-10 minutes")
+                            else:
+                                st.warning("⏳ Complex case - taking longer than usual...")
+                    else:
+                        st.info("📝 **Generating clinical review notes...**")
+                        st.caption("This should complete quickly")
+
+                    # Check status
+                    try:
+                        status_resp = session.get(
+                            f"{API_BASE_URL}/api/patients/{patient_id}/clinical-insights",
+                            timeout=10
+                        )
+
+                        if status_resp.status_code == 200:
+                            status_data = parse_json(status_resp)
+
+                            if status_data["status"] == "completed":
+                                st.session_state[insights_key] = {
+                                    "status": "completed",
+                                    "start_time": None
                                 }
-                                </style>
-                                """, unsafe_allow_html=True)
-                                
-                                st.markdown('<div class="insights-box">', unsafe_allow_html=True)
-                                if llm_available:
-                                    st.markdown("#### 🧠 AI Clinical Analysis")
-                                else:
-                                    st.markdown("#### 📋 Clinical Review Notes")
-                                st.markdown(current_state["insights"])
-                                st.markdown("</div>", unsafe_allow_html=True)
-                                
-                                # Note about insights
-                                st.info("💡 **Note:** These insights are for your reference only and are NOT saved to the patient's permanent record or included in the PDF report.")
+                                st.success("✅ Insights generated!")
+                                st.rerun()
+
+                            elif status_data["status"] == "generating":
+                                # Show the tokens generated so far while the LLM is still running
+                                partial = status_data.get("partial")
+                                if partial:
+                                    st.markdown("#### 🧠 AI Clinical Analysis (in progress)")
+                                    st.markdown(partial + " ▌")
                                 
                                 st.markdown("---")
-                                
-                                # Regenerate button (centered)
-                                col1, col2, col3 = st.columns([1, 1, 1])
-                                
+                                col1, col2 = st.columns(2)
+
                                 with col1:
-                                    pass  # Empty for spacing
-                                
-                                with col2:
-                                    if st.button(
-                                        "🔄 Regenerate Insights",
-                                        use_container_width=True,
-                                        key="regen_insights"
-                                    ):
-                                        st.session_state[insights_key] = {
-                                            "status": "not_requested",
-                                            "insights": None,
-                                            "start_time": None
-                                        }
+                                    if st.button("🔄 Check Now", use_container_width=True):
                                         st.rerun()
-                                
-                                with col3:
-                                    pass  # Empty for spacing
 
-                            # PDF Download
-                            st.markdown("---")
-                            if st.button("📄 Download PDF Report", use_container_width=True):
-                                with st.spinner("Generating PDF..."):
-                                    pdf = download_pdf(st.session_state.selected_patient_id)
-                                    if pdf:
-                                        st.download_button(
-                                            "💾 Save PDF",
-                                            pdf,
-                                            file_name=f"{demo['name'].replace(' ', '_')}_Report.pdf",
-                                            mime="application/pdf",
-                                            use_container_width=True
-                                        )
+                                # Poll quickly once output is streaming, slowly while the model warms up
+                                with col2:
+                                    if llm_available and not partial:
+                                        st.info("🔁 Auto-refresh: 15s")
+                                    else:
+                                        st.info("🔁 Auto-refresh: 3s")
+
+                                if llm_available and not partial:
+                                    st.success("💡 **Tip:** Close and come back - insights will be here!")
+                                    time.sleep(15)
+                                else:
+                                    time.sleep(3)
+
+                                st.rerun()
+
+                            elif status_data["status"] == "failed":
+                                st.error("❌ Generation failed")
+                                st.session_state[insights_key]["status"] = "not_requested"
+                                if st.button("🔄 Try Again"):
+                                    st.rerun()
                         else:
-                            st.error(parse_api_error(detail_resp))
-                    
+                            st.error(parse_api_error(status_resp))
+
                     except requests.exceptions.Timeout:
-                        st.error("⏱️ Request timed out. Please try again.")
+                        st.error("⏱️ Status check timed out.")
+                        if st.button("🔄 Retry"):
+                            st.rerun()
                     except requests.exceptions.ConnectionError:
                         st.error("🔌 Cannot connect to server.")
                     except Exception as e:
-                        st.error("❌ Failed to load patient details.")
-            else:
-                st.error(parse_api_error(resp))
-        
-        except requests.exceptions.Timeout:
-            st.error("⏱️ Request timed out. Please try again.")
-        except requests.exceptions.ConnectionError:
-            st.error("🔌 Cannot connect to server.")
-        except Exception as e:
-            st.error("❌ Failed to load patients.")
+                        st.error(f"⚠️ Error: {str(e)}")
+
+                # ============================================================
+                # DISPLAY RESULTS
+                # ============================================================
+                elif current_state["status"] == "completed":
+                    if llm_available:
+                        st.success("✅ **AI Clinical Insights Generated!**")
+                    else:
+                        st.success("✅ **Clinical Review Notes Generated**")
+
+                    st.markdown('<div class="insights-box">', unsafe_allow_html=True)
+                    if llm_available:
+                        st.markdown("#### 🧠 AI Clinical Analysis")
+                    else:
+                        st.markdown("#### 📋 Clinical Review Notes")
+                    try:
+                        st.markdown(load_insights(
+                            patient_id,
+                            token,
+                            st.session_state.get("insights_gen", {}).get(patient_id, 0)
+                        ))
+                    except Exception as e:
+                        st.error("❌ Failed to load insights. Please regenerate.")
+                    st.markdown("</div>", unsafe_allow_html=True)
+
+                    # Note about insights
+                    st.info("💡 **Note:** These insights are for your reference only and are NOT saved to the patient's permanent record or included in the PDF report.")
+
+                    st.markdown("---")
+
+                    # Regenerate button (centered)
+                    col1, col2, col3 = st.columns([1, 1, 1])
+
+                    with col1:
+                        pass  # Empty for spacing
+
+                    with col2:
+                        st.button(
+                            "🔄 Regenerate Insights",
+                            use_container_width=True,
+                            key="regen_insights",
+                            on_click=reset_insights,
+                            args=(insights_key, patient_id)
+                        )
+
+                    with col3:
+                        pass  # Empty for spacing
+
+                # PDF Download
+                st.markdown("---")
+                if st.button("📄 Download PDF Report", use_container_width=True):
+                    with st.spinner("Generating PDF..."):
+                        pdf = download_pdf(patient_id)
+                        if pdf:
+                            st.download_button(
+                                "💾 Save PDF",
+                                pdf,
+                                file_name=f"{demo['name'].replace(' ', '_')}_Report.pdf",
+                                mime="application/pdf",
+                                use_container_width=True
+                            )
+
+            except requests.exceptions.HTTPError as e:
+                st.error(parse_api_error(e.response))
+            except requests.exceptions.Timeout:
+                st.error("⏱️ Request timed out. Please try again.")
+            except requests.exceptions.ConnectionError:
+                st.error("🔌 Cannot connect to server.")
+            except Exception as e:
+                st.error("❌ Failed to load patient details.")
     
     # ==================== TAB 3: Change Password ====================
     with tab3:
         st.subheader("🔐 Change Password")
         st.info("💡 Update your doctor account password")
         
-        with st.form("change_password_doctor"):
+        with st.form("change_password_doctor", clear_on_submit=True):
             current_pwd = st.text_input("Current Password", type="password")
             new_pwd = st.text_input("New Password (6+ chars)", type="password")
             confirm_pwd = st.text_input("Confirm New Password", type="password")
             
             if st.form_submit_button("🔒 Change Password", use_container_width=True):
-                if not all([current_pwd, new_pwd, confirm_pwd]):
-                    st.error("❌ Please fill all fields")
-                elif len(new_pwd) < 6:
-                    st.error("❌ Password must be at least 6 characters")
-                elif new_pwd != confirm_pwd:
-                    st.error("❌ Passwords don't match")
+                pwd_error = validate_pwd(current_pwd, new_pwd, confirm_pwd)
+                if pwd_error:
+                    st.error(pwd_error)
                 else:
                     with st.spinner("Changing password..."):
                         try:
-                            pwd_resp = requests.post(
+                            pwd_resp = session.post(
                                 f"{API_BASE_URL}/api/doctors/change-password",
-                                headers=headers,
                                 json={
                                     "current_password": current_pwd,
                                     "new_password": new_pwd
@@ -2416,27 +2860,21 @@ def show_doctor_dashboard():
         st.subheader("👤 My Profile")
         
         try:
-            prof_resp = requests.get(
-                f"{API_BASE_URL}/api/doctors/me",
-                headers=headers,
-                timeout=10
-            )
+            # Cached per token - reruns of the other tabs don't refetch it
+            profile = fetch_doctor_profile(token)
             
-            if prof_resp.status_code == 200:
-                profile = prof_resp.json()
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.info(f"**Name:** {profile['name']}")
-                    st.info(f"**Email:** {profile['email']}")
-                with col2:
-                    st.info(f"**Specialization:** {profile['specialization']}")
-                    st.info(f"**License:** {profile['license_number']}")
-                
-                st.info(f"**Status:** {profile['status'].upper()}")
-            else:
-                st.error(parse_api_error(prof_resp))
+            col1, col2 = st.columns(2)
+            with col1:
+                st.info(f"**Name:** {profile['name']}")
+                st.info(f"**Email:** {profile['email']}")
+            with col2:
+                st.info(f"**Specialization:** {profile['specialization']}")
+                st.info(f"**License:** {profile['license_number']}")
+            
+            st.info(f"**Status:** {profile['status'].upper()}")
         
+        except requests.exceptions.HTTPError as e:
+            st.error(parse_api_error(e.response))
         except requests.exceptions.Timeout:
             st.error("⏱️ Request timed out. Please try again.")
         except requests.exceptions.ConnectionError:
@@ -2444,66 +2882,81 @@ def show_doctor_dashboard():
         except Exception as e:
             st.error("❌ Failed to load profile.")
 
+def queue_doctor_op(doctor_id, op):
+    """Button callback: queue (or with op=None, undo) an approve/reject decision"""
+    if op is None:
+        st.session_state.pending_ops.pop(doctor_id, None)
+    else:
+        st.session_state.pending_ops[doctor_id] = op
+
 def show_admin_dashboard():
     """
     COMPLETE ADMIN DASHBOARD
     All API calls with try-catch error handling
     """
+    import pandas as pd  # Only staff dashboards build tables - keep it off the patient/login cold start
     st.title("🔑 Admin Dashboard")
-    headers = {"Authorization": f"Bearer {st.session_state.access_token}"}
+    token = st.session_state.access_token
+    session = get_session(token)
     
-    tab1, tab2, tab3, tab4, tab5 = st.tabs([
-        "📊 Stats & Demographics",
-        "✅ Approve Doctors",
-        "👨‍⚕️ Manage Doctors",
-        "➕ Add Admin",
-        "🔐 Change Password"
-    ])
+    # Section selector instead of st.tabs - Streamlit runs every tab body on
+    # each rerun, so only the visible section should do any network work
+    section = st.radio(
+        "Section",
+        [
+            "📊 Stats & Demographics",
+            "✅ Approve Doctors",
+            "👨‍⚕️ Manage Doctors",
+            "➕ Add Admin",
+            "🔐 Change Password"
+        ],
+        horizontal=True,
+        key="admin_tab",
+        label_visibility="collapsed"
+    )
     
-    # ==================== TAB 1: Stats & Patient Demographics ====================
-    with tab1:
-        st.subheader("System Statistics")
-        
-        # Get counts with error handling
+    # Every read-only list the data sections need, loaded in one batched round trip
+    bundle = {}
+    if section in ("📊 Stats & Demographics", "✅ Approve Doctors", "👨‍⚕️ Manage Doctors"):
+        st.button("🔄 Refresh", key="refresh_admin_data", on_click=refresh_lists)
         try:
-            p_resp = requests.get(
-                f"{API_BASE_URL}/api/admin/patients/count",
-                headers=headers,
-                timeout=10
-            )
-            
-            if p_resp.status_code == 200:
-                p_count = p_resp.json()["count"]
-            else:
-                p_count = "Error"
-                st.error(parse_api_error(p_resp))
+            bundle = fetch_batch((
+                "/api/admin/patients/count",
+                "/api/admin/doctors/count",
+                "/api/admin/patients/all",
+                "/api/admin/doctors/pending",
+                "/api/admin/doctors/all"
+            ), token, st.session_state.list_version)
+        except requests.exceptions.HTTPError as e:
+            st.error(parse_api_error(e.response))
         except requests.exceptions.Timeout:
-            p_count = "Timeout"
-            st.error("⏱️ Failed to load patient count")
+            st.error("⏱️ Request timed out. Please try again.")
         except requests.exceptions.ConnectionError:
-            p_count = "No Connection"
-            st.error("🔌 Cannot connect to server")
+            st.error("🔌 Cannot connect to server.")
         except Exception as e:
+            st.error("❌ Failed to load dashboard data.")
+    
+    # ==================== TAB 1: Stats & Patient Demographics ====================
+    if section == "📊 Stats & Demographics":
+        st.subheader("System Statistics")
+        
+        p_result = bundle.get("/api/admin/patients/count", {})
+        d_result = bundle.get("/api/admin/doctors/count", {})
+        patients_result = bundle.get("/api/admin/patients/all", {})
+        
+        if p_result.get("status_code") == 200:
+            p_count = p_result["body"]["count"]
+        else:
             p_count = "Error"
+            if p_result:
+                st.error(parse_batch_error(p_result, "Failed to load patient count"))
         
-        try:
-            d_resp = requests.get(
-                f"{API_BASE_URL}/api/admin/doctors/count",
-                headers=headers,
-                timeout=10
-            )
-            
-            if d_resp.status_code == 200:
-                d_stats = d_resp.json()
-            else:
-                d_stats = {"approved": "Error", "pending": "Error"}
-                st.error(parse_api_error(d_resp))
-        except requests.exceptions.Timeout:
-            d_stats = {"approved": "Timeout", "pending": "Timeout"}
-        except requests.exceptions.ConnectionError:
-            d_stats = {"approved": "No Connection", "pending": "No Connection"}
-        except Exception as e:
+        if d_result.get("status_code") == 200:
+            d_stats = d_result["body"]
+        else:
             d_stats = {"approved": "Error", "pending": "Error"}
+            if d_result:
+                st.error(parse_batch_error(d_result, "Failed to load doctor stats"))
         
         # Display metrics
         col1, col2, col3 = st.columns(3)
@@ -2514,138 +2967,113 @@ def show_admin_dashboard():
         st.markdown("---")
         st.subheader("👥 Patient Demographics")
         
-        try:
-            patients_resp = requests.get(
-                f"{API_BASE_URL}/api/admin/patients/all",
-                headers=headers,
-                timeout=10
-            )
+        if patients_result.get("status_code") == 200:
+            patients = patients_result["body"]
             
-            if patients_resp.status_code == 200:
-                patients = patients_resp.json()
-                
-                if patients:
-                    for i, p in enumerate(patients, 1):
-                        with st.expander(f"Patient #{i} (Reference: {p['reference_id']})"):
-                            col1, col2 = st.columns(2)
-                            with col1:
-                                st.write(f"**Name:** {p['name']}")
-                                st.write(f"**Age:** {p['age']}")
-                                st.write(f"**Gender:** {p['gender']}")
-                            with col2:
-                                st.write(f"**Email:** {p['email']}")
-                                st.write(f"**Phone:** {p['phone']}")
-                else:
-                    st.info("No patients registered yet")
+            if patients:
+                df = pd.DataFrame(patients)[["reference_id", "name", "age", "gender", "email", "phone"]]
+                df.columns = ["Reference", "Name", "Age", "Gender", "Email", "Phone"]
+                st.dataframe(df, use_container_width=True, hide_index=True)
             else:
-                st.error(parse_api_error(patients_resp))
-        
-        except requests.exceptions.Timeout:
-            st.error("⏱️ Request timed out. Please try again.")
-        except requests.exceptions.ConnectionError:
-            st.error("🔌 Cannot connect to server.")
-        except Exception as e:
-            st.error("❌ Failed to load patients.")
+                st.info("No patients registered yet")
+        elif patients_result:
+            st.error(parse_batch_error(patients_result, "Failed to load patients"))
     
     # ==================== TAB 2: Approve Doctor Accounts ====================
-    with tab2:
+    elif section == "✅ Approve Doctors":
         st.subheader("✅ Approve Doctor Accounts")
         
-        try:
-            pending_resp = requests.get(
-                f"{API_BASE_URL}/api/admin/doctors/pending",
-                headers=headers,
-                timeout=10
-            )
+        pending_result = bundle.get("/api/admin/doctors/pending", {})
+        
+        if pending_result.get("status_code") == 200:
+            pending = pending_result["body"]
             
-            if pending_resp.status_code == 200:
-                pending = pending_resp.json()
+            if not pending:
+                st.info("✅ No pending doctor accounts to approve")
+            else:
+                st.warning(f"⏳ {len(pending)} doctor(s) waiting for approval")
                 
-                if not pending:
-                    st.info("✅ No pending doctor accounts to approve")
-                else:
-                    st.warning(f"⏳ {len(pending)} doctor(s) waiting for approval")
+                pending_ops = st.session_state.pending_ops
+                
+                for doc in pending:
+                    queued = pending_ops.get(doc['id'])
+                    label = f"Dr. {doc['name']} - {doc['specialization']}"
+                    if queued:
+                        label += f" ({'✅ approve' if queued == 'approve' else '❌ reject'} queued)"
                     
-                    for doc in pending:
-                        with st.expander(f"Dr. {doc['name']} - {doc['specialization']}"):
-                            st.write(f"**Email:** {doc['email']}")
-                            st.write(f"**License:** {doc['license_number']}")
-                            
-                            col1, col2 = st.columns(2)
-                            
-                            with col1:
-                                if st.button(
-                                    "✅ Approve",
-                                    key=f"approve_{doc['id']}",
-                                    use_container_width=True
-                                ):
-                                    try:
-                                        approve_resp = requests.post(
-                                            f"{API_BASE_URL}/api/admin/doctors/approve",
-                                            headers=headers,
-                                            json={
-                                                "doctor_id": doc['id'],
-                                                "approved": True
-                                            },
-                                            timeout=10
-                                        )
-                                        
-                                        if approve_resp.status_code == 200:
-                                            st.success("✅ Doctor approved!")
-                                            time.sleep(1)
-                                            st.rerun()
-                                        else:
-                                            st.error(parse_api_error(approve_resp))
-                                    
-                                    except requests.exceptions.Timeout:
-                                        st.error("⏱️ Request timed out.")
-                                    except requests.exceptions.ConnectionError:
-                                        st.error("🔌 Cannot connect to server.")
-                                    except Exception as e:
-                                        st.error("❌ Approval failed.")
-                            
-                            with col2:
-                                if st.button(
-                                    "❌ Reject",
-                                    key=f"reject_{doc['id']}",
-                                    use_container_width=True
-                                ):
-                                    try:
-                                        reject_resp = requests.post(
-                                            f"{API_BASE_URL}/api/admin/doctors/approve",
-                                            headers=headers,
-                                            json={
-                                                "doctor_id": doc['id'],
-                                                "approved": False
-                                            },
-                                            timeout=10
-                                        )
-                                        
-                                        if reject_resp.status_code == 200:
-                                            st.success("✅ Doctor rejected")
-                                            time.sleep(1)
-                                            st.rerun()
-                                        else:
-                                            st.error(parse_api_error(reject_resp))
-                                    
-                                    except requests.exceptions.Timeout:
-                                        st.error("⏱️ Request timed out.")
-                                    except requests.exceptions.ConnectionError:
-                                        st.error("🔌 Cannot connect to server.")
-                                    except Exception as e:
-                                        st.error("❌ Rejection failed.")
-            else:
-                st.error(parse_api_error(pending_resp))
-        
-        except requests.exceptions.Timeout:
-            st.error("⏱️ Request timed out. Please try again.")
-        except requests.exceptions.ConnectionError:
-            st.error("🔌 Cannot connect to server.")
-        except Exception as e:
-            st.error("❌ Failed to load pending doctors.")
+                    with st.expander(label):
+                        st.markdown(f"**Email:** {doc['email']}  \n**License:** {doc['license_number']}")
+                        
+                        col1, col2, col3 = st.columns(3)
+                        
+                        # Decisions are queued locally and sent together with "Apply"
+                        with col1:
+                            st.button(
+                                "✅ Approve",
+                                key=f"approve_{doc['id']}",
+                                use_container_width=True,
+                                on_click=queue_doctor_op,
+                                args=(doc['id'], "approve")
+                            )
+                        
+                        with col2:
+                            st.button(
+                                "❌ Reject",
+                                key=f"reject_{doc['id']}",
+                                use_container_width=True,
+                                on_click=queue_doctor_op,
+                                args=(doc['id'], "reject")
+                            )
+                        
+                        with col3:
+                            st.button(
+                                "↩️ Undo",
+                                key=f"undo_{doc['id']}",
+                                disabled=not queued,
+                                use_container_width=True,
+                                on_click=queue_doctor_op,
+                                args=(doc['id'], None)
+                            )
+                
+                # Drop queued decisions for doctors that are no longer pending
+                pending_ids = {doc['id'] for doc in pending}
+                ops = [
+                    {"op": op, "doctor_id": doctor_id}
+                    for doctor_id, op in pending_ops.items()
+                    if doctor_id in pending_ids
+                ]
+                
+                if st.button(
+                    f"💾 Apply Changes ({len(ops)})",
+                    disabled=not ops,
+                    type="primary",
+                    key="apply_pending_ops"
+                ):
+                    try:
+                        bulk_resp = session.post(
+                            f"{API_BASE_URL}/api/admin/doctors/bulk",
+                            json={"ops": ops},
+                            timeout=15
+                        )
+                        
+                        if bulk_resp.status_code == 200:
+                            st.session_state.pending_ops = {}
+                            refresh_lists()
+                            st.success(f"✅ Applied {len(ops)} decision(s)")
+                            time.sleep(1)
+                            st.rerun()
+                        else:
+                            st.error(parse_api_error(bulk_resp))
+                    
+                    except requests.exceptions.Timeout:
+                        st.error("⏱️ Request timed out.")
+                    except requests.exceptions.ConnectionError:
+                        st.error("🔌 Cannot connect to server.")
+        elif pending_result:
+            st.error(parse_batch_error(pending_result, "Failed to load pending doctors."))
     
     # ==================== TAB 3: Manage Doctor Accounts ====================
-    with tab3:
+    elif section == "👨‍⚕️ Manage Doctors":
         st.subheader("👨‍⚕️ Manage Doctor Accounts")
         
         manage_option = st.radio(
@@ -2655,60 +3083,44 @@ def show_admin_dashboard():
         )
         
         if manage_option == "View All Doctors":
-            try:
-                all_docs_resp = requests.get(
-                    f"{API_BASE_URL}/api/admin/doctors/all",
-                    headers=headers,
-                    timeout=10
-                )
-                
-                if all_docs_resp.status_code == 200:
-                    doctors = all_docs_resp.json()
-                    
-                    if doctors:
-                        for doc in doctors:
-                            status_icon = "🟢" if doc['status'] == "approved" else "🔴"
-                            
-                            with st.expander(f"{status_icon} Dr. {doc['name']} - {doc['email']} ({doc['status'].upper()})"):
-                                st.write(f"**Specialization:** {doc['specialization']}")
-                                st.write(f"**License:** {doc['license_number']}")
-                                st.write(f"**Status:** {doc['status'].upper()}")
-                    else:
-                        st.info("No doctors registered yet")
-                else:
-                    st.error(parse_api_error(all_docs_resp))
+            doctors_result = bundle.get("/api/admin/doctors/all", {})
             
-            except requests.exceptions.Timeout:
-                st.error("⏱️ Request timed out.")
-            except requests.exceptions.ConnectionError:
-                st.error("🔌 Cannot connect to server.")
-            except Exception as e:
-                st.error("❌ Failed to load doctors.")
+            if doctors_result.get("status_code") != 200:
+                if doctors_result:
+                    st.error(parse_batch_error(doctors_result, "Failed to load doctors."))
+            elif doctors_result["body"]:
+                doctors = doctors_result["body"]
+                df = pd.DataFrame(doctors)[["name", "email", "specialization", "license_number", "status"]]
+                df["status"] = df["status"].map(STATUS_DISPLAY).fillna("⚪ " + df["status"].str.upper())
+                df.columns = ["Name", "Email", "Specialization", "License", "Status"]
+                st.dataframe(df, use_container_width=True, hide_index=True)
+            else:
+                st.info("No doctors registered yet")
         
         elif manage_option == "Search by Name":
-            search_name = st.text_input("Enter doctor name:", key="search_doctor_name")
+            # text_input only commits on Enter/blur, so each query hits the cache at most once
+            search_name = st.text_input("Enter doctor name:", key="search_doctor_name").strip()
             
-            if st.button("🔍 Search", key="search_doctor_btn") and search_name:
+            if search_name:
                 try:
-                    search_resp = requests.get(
+                    results = fetch_json(
                         f"{API_BASE_URL}/api/admin/doctors/all",
-                        headers=headers,
-                        params={"search_name": search_name},
-                        timeout=10
+                        token,
+                        params=(("search_name", search_name),),
+                        version=st.session_state.list_version
                     )
                     
-                    if search_resp.status_code == 200:
-                        results = search_resp.json()
-                        
-                        if results:
-                            st.success(f"Found {len(results)} doctor(s)")
-                            for doc in results:
-                                st.write(f"**{doc['name']}** - {doc['email']} ({doc['status']})")
-                        else:
-                            st.warning("No doctors found matching your search")
+                    if results:
+                        st.success(f"Found {len(results)} doctor(s)")
+                        st.markdown("  \n".join(
+                            f"**{doc['name']}** - {doc['email']} ({STATUS_DISPLAY.get(doc['status'], doc['status'])})"
+                            for doc in results
+                        ))
                     else:
-                        st.error(parse_api_error(search_resp))
+                        st.warning("No doctors found matching your search")
                 
+                except requests.exceptions.HTTPError as e:
+                    st.error(parse_api_error(e.response))
                 except requests.exceptions.Timeout:
                     st.error("⏱️ Request timed out.")
                 except requests.exceptions.ConnectionError:
@@ -2717,90 +3129,66 @@ def show_admin_dashboard():
                     st.error("❌ Search failed.")
         
         else:  # Disable/Enable
-            try:
-                all_docs_resp = requests.get(
-                    f"{API_BASE_URL}/api/admin/doctors/all",
-                    headers=headers,
-                    timeout=10
+            doctors_result = bundle.get("/api/admin/doctors/all", {})
+            
+            if doctors_result.get("status_code") != 200:
+                if doctors_result:
+                    st.error(parse_batch_error(doctors_result, "Failed to load doctors."))
+            elif doctors_result["body"]:
+                doctors = doctors_result["body"]
+                st.info("💡 Tick the accounts to change - approved doctors are disabled, others are enabled")
+                
+                df = pd.DataFrame(doctors)[["id", "name", "email", "specialization", "status"]]
+                df["status"] = df["status"].map(STATUS_DISPLAY).fillna("⚪ " + df["status"].str.upper())
+                df.insert(0, "toggle", False)
+                
+                edited = st.data_editor(
+                    df,
+                    column_config={
+                        "toggle": st.column_config.CheckboxColumn("Toggle"),
+                        "id": None,
+                        "name": "Name",
+                        "email": "Email",
+                        "specialization": "Specialization",
+                        "status": "Status"
+                    },
+                    disabled=["name", "email", "specialization", "status"],
+                    hide_index=True,
+                    use_container_width=True,
+                    key="toggle_doctors_editor"
                 )
                 
-                if all_docs_resp.status_code == 200:
-                    doctors = all_docs_resp.json()
+                selected_ids = edited.loc[edited["toggle"], "id"].tolist()
+                
+                if st.button(
+                    f"🔄 Apply Status Changes ({len(selected_ids)})",
+                    disabled=not selected_ids,
+                    key="apply_doctor_toggles"
+                ):
+                    try:
+                        bulk_resp = session.post(
+                            f"{API_BASE_URL}/api/admin/doctors/bulk",
+                            json={"ops": [{"op": "toggle", "doctor_id": doctor_id} for doctor_id in selected_ids]},
+                            timeout=15
+                        )
+                        
+                        if bulk_resp.status_code == 200:
+                            refresh_lists()
+                            st.success(f"✅ Updated {len(selected_ids)} doctor account(s)")
+                            time.sleep(1)
+                            st.rerun()
+                        else:
+                            st.error(parse_api_error(bulk_resp))
                     
-                    if doctors:
-                        for doc in doctors:
-                            status_icon = "🟢" if doc['status'] == "approved" else "🔴"
-                            
-                            with st.expander(f"{status_icon} Dr. {doc['name']} ({doc['status']})"):
-                                st.write(f"**Email:** {doc['email']}")
-                                st.write(f"**Specialization:** {doc['specialization']}")
-                                
-                                if doc['status'] == "approved":
-                                    if st.button(
-                                        f"🔴 Disable Dr. {doc['name']}",
-                                        key=f"disable_{doc['id']}"
-                                    ):
-                                        try:
-                                            toggle_resp = requests.post(
-                                                f"{API_BASE_URL}/api/admin/doctors/toggle",
-                                                headers=headers,
-                                                json={"doctor_id": doc['id']},
-                                                timeout=10
-                                            )
-                                            
-                                            if toggle_resp.status_code == 200:
-                                                st.success("✅ Doctor disabled")
-                                                time.sleep(1)
-                                                st.rerun()
-                                            else:
-                                                st.error(parse_api_error(toggle_resp))
-                                        
-                                        except requests.exceptions.Timeout:
-                                            st.error("⏱️ Request timed out.")
-                                        except requests.exceptions.ConnectionError:
-                                            st.error("🔌 Cannot connect to server.")
-                                        except Exception as e:
-                                            st.error("❌ Action failed.")
-                                else:
-                                    if st.button(
-                                        f"🟢 Enable Dr. {doc['name']}",
-                                        key=f"enable_{doc['id']}"
-                                    ):
-                                        try:
-                                            toggle_resp = requests.post(
-                                                f"{API_BASE_URL}/api/admin/doctors/toggle",
-                                                headers=headers,
-                                                json={"doctor_id": doc['id']},
-                                                timeout=10
-                                            )
-                                            
-                                            if toggle_resp.status_code == 200:
-                                                st.success("✅ Doctor enabled")
-                                                time.sleep(1)
-                                                st.rerun()
-                                            else:
-                                                st.error(parse_api_error(toggle_resp))
-                                        
-                                        except requests.exceptions.Timeout:
-                                            st.error("⏱️ Request timed out.")
-                                        except requests.exceptions.ConnectionError:
-                                            st.error("🔌 Cannot connect to server.")
-                                        except Exception as e:
-                                            st.error("❌ Action failed.")
-                    else:
-                        st.info("No doctors to manage")
-                else:
-                    st.error(parse_api_error(all_docs_resp))
-            
-            except requests.exceptions.Timeout:
-                st.error("⏱️ Request timed out.")
-            except requests.exceptions.ConnectionError:
-                st.error("🔌 Cannot connect to server.")
-            except Exception as e:
-                st.error("❌ Failed to load doctors.")
+                    except requests.exceptions.Timeout:
+                        st.error("⏱️ Request timed out.")
+                    except requests.exceptions.ConnectionError:
+                        st.error("🔌 Cannot connect to server.")
+            else:
+                st.info("No doctors to manage")
     
     # ==================== TAB 4: Add Admin Account ====================
-    with tab4:
+    elif section == "➕ Add Admin":
         st.subheader("➕ Add New Administrator")
         
         with st.form("add_admin"):
@@ -2821,9 +3209,8 @@ def show_admin_dashboard():
                 else:
                     with st.spinner("Creating admin account..."):
                         try:
-                            create_resp = requests.post(
+                            create_resp = session.post(
                                 f"{API_BASE_URL}/api/admin/create",
-                                headers=headers,
                                 json={
                                     "name": new_name,
                                     "email": new_email,
@@ -2846,28 +3233,24 @@ def show_admin_dashboard():
                             st.error("❌ Admin creation failed. Please try again.")
     
     # ==================== TAB 5: Change Password ====================
-    with tab5:
+    elif section == "🔐 Change Password":
         st.subheader("🔐 Change Password")
         st.info("💡 Update your admin account password")
         
-        with st.form("change_password_admin"):
+        with st.form("change_password_admin", clear_on_submit=True):
             current_pwd = st.text_input("Current Password", type="password")
             new_pwd = st.text_input("New Password (6+ chars)", type="password")
             confirm_pwd = st.text_input("Confirm New Password", type="password")
             
             if st.form_submit_button("🔒 Change Password", use_container_width=True):
-                if not all([current_pwd, new_pwd, confirm_pwd]):
-                    st.error("❌ Please fill all fields")
-                elif len(new_pwd) < 6:
-                    st.error("❌ Password must be at least 6 characters")
-                elif new_pwd != confirm_pwd:
-                    st.error("❌ Passwords don't match")
+                pwd_error = validate_pwd(current_pwd, new_pwd, confirm_pwd)
+                if pwd_error:
+                    st.error(pwd_error)
                 else:
                     with st.spinner("Changing password..."):
                         try:
-                            pwd_resp = requests.post(
+                            pwd_resp = session.post(
                                 f"{API_BASE_URL}/api/admin/change-password",
-                                headers=headers,
                                 json={
                                     "current_password": current_pwd,
                                     "new_password": new_pwd